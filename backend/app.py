@@ -7,11 +7,16 @@ middleware setup, and route registration.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+import asyncio
 import logging
 import os
 
 from config import settings
-from routes import health, ingest, query
+from middleware.rate_limit import limiter
+from routes import health, ingest, metrics, query
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,9 +29,20 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="RAG System API",
         description="A simple RAG pipeline for PDF document processing",
-        version="1.0.0"
+        version="1.0.0",
+        # orjson handles the kilobyte chunk payloads in QueryResponse far
+        # faster than the stdlib json encoder
+        default_response_class=ORJSONResponse
     )
     
+    # Attach the shared rate limiter
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+    # Flipped by the startup warm-up task; reported by /health so
+    # readiness probes can wait for the pipeline
+    app.state.pipeline_ready = False
+    
     # Configure CORS origins based on environment
     allowed_origins = [
         "http://localhost:3000", 
@@ -51,6 +67,7 @@ def create_app() -> FastAPI:
     app.include_router(health.router)
     app.include_router(ingest.router)
     app.include_router(query.router)
+    app.include_router(metrics.router)
     
     logger.info("FastAPI application configured successfully")
     return app
@@ -58,6 +75,31 @@ def create_app() -> FastAPI:
 # Create the app instance
 app = create_app()
 
+@app.on_event("startup")
+async def warm_pipeline():
+    """
+    Warm the RAG pipeline in the background at startup
+
+    Pipeline construction (component init plus the sklearn import chain)
+    runs on a worker thread and the LLM DNS + TLS handshake follows, all
+    as a background task — uvicorn accepts connections immediately and
+    the first request still pays no cold-start penalty. /health reports
+    pipeline_ready so readiness probes can hold traffic until warm.
+    """
+    async def _warm():
+        pipeline = await asyncio.to_thread(query.get_rag_pipeline)
+        await pipeline.llm_client.awarmup()
+        app.state.pipeline_ready = True
+        logger.info("Pipeline warm-up complete")
+
+    # Keep a reference so the task is not garbage collected mid-flight
+    app.state.warmup_task = asyncio.create_task(_warm())
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    # uvloop and httptools (bundled with uvicorn[standard]) are pinned
+    # explicitly rather than left to "auto" detection. Kept single-worker:
+    # storage, the search index, and the rate limiter default all live
+    # in-process, so extra workers would each see their own corpus; scale
+    # out only after moving that state to a shared backend.
+    uvicorn.run(app, host="127.0.0.1", port=8000, loop="uvloop", http="httptools")
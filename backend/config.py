@@ -28,10 +28,18 @@ class Settings(BaseSettings):
     MAX_TOKENS: int = 1000
     TEMPERATURE: float = 0.1
     
+    # Semantic Cache Configuration
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 256
+    SEMANTIC_CACHE_TTL_SECONDS: float = 600.0
+    
     # Rate Limiting Configuration
     RATE_LIMIT_QUERY: str = "30/minute"
     RATE_LIMIT_UPLOAD: str = "10/minute"
     RATE_LIMIT_HEALTH: str = "60/minute"
+    # Point at Redis (redis://host:port) for multi-worker deployments;
+    # the in-memory default keeps counters per process
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
     
     class Config:
         env_file = ".env"  # Fix path - should be in backend directory
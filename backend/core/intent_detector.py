@@ -7,7 +7,7 @@ the detection process with proper priority handling.
 """
 
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from .intents.basic_intents import BasicIntents
 from .intents.document_intents import DocumentIntents
 from .intents.system_intents import SystemIntents
@@ -34,21 +34,27 @@ class IntentDetector:
             self.specialized_intents # Specialized processing
         ]
     
-    def detect_intent(self, query: str) -> str:
+    def detect_intent(self, query: str, query_lower: Optional[str] = None) -> str:
         """
         Detect the intent of a user query using modular components
-        
+
         Args:
             query: User's query text
-            
+            query_lower: Pre-lowercased query (optional, computed if not provided)
+
         Returns:
-            Intent classification: 'greeting', 'thanks', 'command', 'document_command', 
-            'system_command', 'summary_request', 'data_extraction', 'unclear', 
+            Intent classification: 'greeting', 'thanks', 'command', 'document_command',
+            'system_command', 'summary_request', 'data_extraction', 'unclear',
             'out_of_scope', 'question'
         """
+        # Lowercase and strip once, shared by every intent category
+        if query_lower is None:
+            query_lower = query.lower()
+        query_lower_stripped = query_lower.strip()
+
         # Check each intent category in priority order
         for intent_category in self.intent_categories:
-            matches = intent_category.detect_intents(query)
+            matches = intent_category.detect_intents(query, query_lower_stripped)
             if matches:
                 # Return the first (highest confidence) match
                 return matches[0][0]
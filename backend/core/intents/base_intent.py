@@ -26,17 +26,19 @@ class BaseIntent(ABC):
         """
         pass
     
-    def detect_intents(self, query: str) -> List[Tuple[str, float]]:
+    def detect_intents(self, query: str, query_lower: Optional[str] = None) -> List[Tuple[str, float]]:
         """
         Detect all matching intents in the query with confidence scores
-        
+
         Args:
             query: User query text
-            
+            query_lower: Pre-lowercased and stripped query (optional, computed if not provided)
+
         Returns:
             List of (intent_name, confidence_score) tuples
         """
-        query_lower = query.lower().strip()
+        if query_lower is None:
+            query_lower = query.lower().strip()
         matches = []
         
         for intent_name, patterns in self.intent_patterns.items():
@@ -9,14 +9,23 @@ This package handles:
 """
 
 from .client import MistralClient
+from .async_client import AsyncMistralClient
 from .api_connector import APIConnector
+from .async_connector import AsyncAPIConnector
+from .batcher import LLMRequestBatcher
 from .prompt_manager import PromptManager
+from .exceptions import LLMError, RateLimitError
 from .rate_limiter import RateLimiter
 from .validator import ResponseValidator
 
 __all__ = [
     'MistralClient',
+    'AsyncMistralClient',
     'APIConnector',
+    'AsyncAPIConnector',
+    'LLMRequestBatcher',
+    'LLMError',
+    'RateLimitError',
     'PromptManager',
     'RateLimiter',
     'ResponseValidator'
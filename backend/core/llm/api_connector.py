@@ -9,6 +9,8 @@ import json
 import time
 from typing import Dict, Any, Optional, List
 from config import settings
+from . import metrics
+from .exceptions import RateLimitError
 import logging
 
 class APIConnector:
@@ -58,6 +60,14 @@ class APIConnector:
         headers = self.headers.copy()
         headers["Authorization"] = self.get_authorization_header()
         
+        with metrics.track_call(self.model):
+            response = self._request_with_retries(payload, headers)
+        
+        metrics.record_usage(self.model, response)
+        return response
+    
+    def _request_with_retries(self, payload: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        """Run the request/retry loop and return the decoded response"""
         for attempt in range(self.max_retries):
             try:
                 # Log request size for debugging
@@ -89,7 +99,7 @@ class APIConnector:
                         time.sleep(wait_time)
                         continue
                     else:
-                        raise Exception(f"Rate limit exceeded after {self.max_retries} attempts")
+                        raise RateLimitError(f"Rate limit exceeded after {self.max_retries} attempts")
                 else:
                     raise Exception(f"API request failed with status {response.status_code}: {response.text}")
                     
@@ -0,0 +1,164 @@
+"""
+Async LLM Client Module
+
+Provides AsyncMistralClient, a drop-in superset of MistralClient that adds
+awaitable generation methods backed by a non-blocking HTTP connector.
+Synchronous callers keep using the inherited MistralClient interface.
+"""
+
+from typing import AsyncIterator, List
+
+from .client import MistralClient
+from .async_connector import AsyncAPIConnector
+from .batcher import LLMRequestBatcher
+from .exceptions import RateLimitError
+
+class AsyncMistralClient(MistralClient):
+    """LLM client with async generation methods for I/O-bound request paths"""
+
+    def __init__(self):
+        super().__init__()
+        self.async_connector = AsyncAPIConnector()
+        # Coalesce concurrent requests into shared dispatch windows
+        self.batcher = LLMRequestBatcher(self.async_connector.make_request)
+
+    async def agenerate_response(self, prompt: str, context: str = "", max_tokens: int = 1000) -> str:
+        """
+        Generate response using Mistral AI API without blocking the event loop
+
+        Args:
+            prompt: The main prompt for the LLM
+            context: Additional context to include (optional)
+            max_tokens: Maximum tokens for response
+
+        Returns:
+            Generated response text
+
+        Raises:
+            Exception: If API call fails after retries
+        """
+        try:
+            # Prepare the full prompt with context
+            full_prompt = self._prepare_prompt(prompt, context)
+
+            # Create chat messages
+            messages = [
+                {
+                    "role": "user",
+                    "content": full_prompt
+                }
+            ]
+
+            # Create request payload (reuses the sync connector's builder)
+            payload = self.api_connector.create_chat_payload(
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=0.7,
+                top_p=0.9
+            )
+
+            # Make async API request through the micro-batcher
+            response = await self.batcher.submit(payload)
+
+            # Extract response text
+            response_text = self.api_connector.extract_response_text(response)
+
+            # Validate response
+            validation_result = self.validator.validate_response(response_text)
+            if not validation_result['is_valid']:
+                # Log validation issues but still return the response
+                pass
+
+            return response_text
+
+        except RateLimitError:
+            raise
+        except Exception as e:
+            raise Exception(f"Failed to generate response: {str(e)}")
+
+    async def agenerate_rag_response(self, question: str, context_chunks: List[str], max_tokens: int = 1000) -> str:
+        """
+        Generate RAG response with context without blocking the event loop
+
+        Args:
+            question: User's question
+            context_chunks: List of context chunks
+            max_tokens: Maximum tokens for response
+
+        Returns:
+            Generated response text
+        """
+        # Format context chunks
+        context = self.prompt_manager.format_context_chunks(context_chunks)
+
+        # Create RAG prompt
+        prompt = self.prompt_manager.create_rag_prompt(question, context, max_tokens)
+
+        # Generate response
+        return await self.agenerate_response(prompt, max_tokens=max_tokens)
+
+    async def astream_response(self, prompt: str, context: str = "", max_tokens: int = 1000) -> AsyncIterator[str]:
+        """
+        Stream a response token-by-token instead of waiting for completion
+
+        Args:
+            prompt: The main prompt for the LLM
+            context: Additional context to include (optional)
+            max_tokens: Maximum tokens for response
+
+        Yields:
+            Content tokens as they arrive from the API
+
+        Raises:
+            Exception: If the streaming request fails
+        """
+        # Prepare the full prompt with context
+        full_prompt = self._prepare_prompt(prompt, context)
+
+        # Create chat messages
+        messages = [
+            {
+                "role": "user",
+                "content": full_prompt
+            }
+        ]
+
+        # Create request payload with streaming enabled
+        payload = self.api_connector.create_chat_payload(
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=0.7,
+            top_p=0.9
+        )
+        payload["stream"] = True
+
+        async for token in self.async_connector.stream_request(payload):
+            yield token
+
+    async def astream_rag_response_with_references(self, question: str, context_chunks: List[str], max_tokens: int = 1000) -> AsyncIterator[str]:
+        """
+        Stream a RAG response with numbered references token-by-token
+
+        Uses the same references prompt as the blocking variant, so the
+        streamed answer matches what generate_rag_response_with_references
+        would have produced.
+
+        Args:
+            question: User's question
+            context_chunks: List of context chunks
+            max_tokens: Maximum tokens for response
+
+        Yields:
+            Content tokens as they arrive from the API
+        """
+        prompt = self._build_references_prompt(question, context_chunks)
+        async for token in self.astream_response(prompt, max_tokens=max_tokens):
+            yield token
+
+    async def awarmup(self) -> None:
+        """Pre-open the API connection to avoid first-request TLS latency"""
+        await self.async_connector.warmup()
+
+    async def aclose(self) -> None:
+        """Close the underlying async HTTP client"""
+        await self.async_connector.close()
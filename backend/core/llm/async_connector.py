@@ -0,0 +1,253 @@
+"""
+Async API Connector Module
+
+Handles non-blocking HTTP requests to the Mistral AI API with retry logic.
+Mirrors APIConnector but uses a shared httpx.AsyncClient so an ASGI server
+can overlap many in-flight LLM calls on one worker.
+"""
+
+import asyncio
+import json
+import random
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from config import settings
+from . import metrics
+from .exceptions import RateLimitError
+import logging
+
+class AsyncAPIConnector:
+    """Handles async HTTP requests to Mistral AI API"""
+
+    def __init__(self):
+        self.base_url = settings.MISTRAL_BASE_URL
+        self.model = settings.MODEL_NAME
+
+        # Request configuration (matches APIConnector)
+        self.timeout = 15
+        self.max_retries = 3
+        self.retry_delay = 1
+
+        # Headers for API requests
+        self.headers = {
+            "Content-Type": "application/json"
+        }
+
+        # Bound in-flight requests so traffic spikes shed load gracefully
+        # instead of hammering the API into sustained 429s
+        self.max_concurrent_requests = 16
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        # Shared client, created lazily so construction works outside a loop
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # Configure logging
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    def get_authorization_header(self) -> str:
+        """
+        Get the current authorization header with the latest API key
+
+        Returns:
+            Authorization header string
+        """
+        return f"Bearer {settings.MISTRAL_API_KEY}"
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the shared async HTTP client"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    async def warmup(self) -> None:
+        """
+        Pre-open a connection to the API so the first real request skips
+        DNS resolution and the TLS handshake
+
+        Best-effort: failures are logged, never raised, so a transient
+        network issue cannot block application startup.
+        """
+        headers = self.headers.copy()
+        headers["Authorization"] = self.get_authorization_header()
+
+        try:
+            await self._get_client().get(f"{self.base_url}/models", headers=headers)
+        except httpx.HTTPError as e:
+            self.logger.warning(f"LLM client warmup failed: {str(e)}")
+
+    async def close(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+    async def make_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Make an async request to the Mistral AI API
+
+        Args:
+            payload: Request payload
+
+        Returns:
+            API response as dictionary
+
+        Raises:
+            Exception: If all retry attempts fail
+        """
+        # Update authorization header with latest API key
+        headers = self.headers.copy()
+        headers["Authorization"] = self.get_authorization_header()
+
+        client = self._get_client()
+
+        with metrics.track_call(self.model):
+            response = await self._request_with_retries(client, headers, payload)
+
+        metrics.record_usage(self.model, response)
+        return response
+
+    async def _request_with_retries(self, client: httpx.AsyncClient, headers: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the request/retry loop under the concurrency semaphore"""
+        # Hold the semaphore across retries and backoff waits so a stressed
+        # upstream also throttles our own submission rate
+        async with self._semaphore:
+            for attempt in range(self.max_retries):
+                try:
+                    response = await client.post(
+                        f"{self.base_url}/chat/completions",
+                        headers=headers,
+                        json=payload
+                    )
+
+                    # Handle different response status codes
+                    if response.status_code == 200:
+                        return response.json()
+                    elif response.status_code == 401:
+                        raise Exception(f"API request failed with status 401: {response.text}")
+                    elif response.status_code == 429:
+                        self.logger.warning(f"Rate limit exceeded. Status: {response.status_code}")
+                        self.logger.warning(f"Retry-After: {response.headers.get('Retry-After', 'Unknown')}")
+
+                        if attempt < self.max_retries - 1:
+                            wait_time = self._calculate_rate_limit_wait(response)
+                            await asyncio.sleep(wait_time + self._jitter())
+                            continue
+                        else:
+                            raise RateLimitError(f"Rate limit exceeded after {self.max_retries} attempts")
+                    elif response.status_code >= 500:
+                        # Transient server errors are retried like timeouts
+                        if attempt < self.max_retries - 1:
+                            await asyncio.sleep(self._backoff(attempt))
+                            continue
+                        else:
+                            raise Exception(f"API request failed with status {response.status_code}: {response.text}")
+                    else:
+                        raise Exception(f"API request failed with status {response.status_code}: {response.text}")
+
+                except httpx.TimeoutException:
+                    if attempt < self.max_retries - 1:
+                        await asyncio.sleep(self._backoff(attempt))
+                        continue
+                    else:
+                        raise Exception(f"Request timeout after {self.max_retries} attempts")
+
+                except httpx.HTTPError as e:
+                    if attempt < self.max_retries - 1:
+                        await asyncio.sleep(self._backoff(attempt))
+                        continue
+                    else:
+                        raise Exception(f"Request failed: {str(e)}")
+
+        # If we get here, all retries failed
+        raise Exception(f"All retry attempts failed")
+
+    def _backoff(self, attempt: int) -> float:
+        """Linear backoff with jitter to de-synchronize concurrent retries"""
+        return self.retry_delay * (attempt + 1) + self._jitter()
+
+    @staticmethod
+    def _jitter() -> float:
+        """Small random delay added to every backoff wait"""
+        return random.uniform(0, 0.25)
+
+    async def stream_request(self, payload: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream a chat completion, yielding content tokens as they arrive
+
+        Args:
+            payload: Request payload (must include "stream": True)
+
+        Yields:
+            Content deltas from the server-sent event stream
+
+        Raises:
+            Exception: If the request fails
+        """
+        headers = self.headers.copy()
+        headers["Authorization"] = self.get_authorization_header()
+
+        client = self._get_client()
+
+        async with client.stream(
+            "POST",
+            f"{self.base_url}/chat/completions",
+            headers=headers,
+            json=payload
+        ) as response:
+            if response.status_code != 200:
+                body = await response.aread()
+                raise Exception(f"API request failed with status {response.status_code}: {body.decode('utf-8', 'replace')}")
+
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+
+                data = line[len("data: "):]
+                if data == "[DONE]":
+                    break
+
+                try:
+                    event = json.loads(data)
+                except json.JSONDecodeError:
+                    continue
+
+                choices = event.get("choices", [])
+                if not choices:
+                    continue
+
+                delta = choices[0].get("delta", {}).get("content")
+                if delta:
+                    yield delta
+
+    def _calculate_rate_limit_wait(self, response: httpx.Response) -> float:
+        """
+        Calculate wait time for rate limit response
+
+        Args:
+            response: Rate limit response
+
+        Returns:
+            Wait time in seconds
+        """
+        try:
+            # Try to get retry-after header
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                return float(retry_after)
+
+            # Try to get rate limit reset time
+            reset_time = response.headers.get('X-RateLimit-Reset')
+            if reset_time:
+                import time
+                current_time = int(time.time())
+                wait_time = int(reset_time) - current_time
+                if wait_time > 0:
+                    return float(wait_time) + 1.0  # Add 1 second buffer
+
+            # Fallback: conservative wait
+            return 60.0
+
+        except (ValueError, TypeError):
+            return 60.0
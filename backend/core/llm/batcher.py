@@ -0,0 +1,97 @@
+"""
+LLM Request Batcher Module
+
+Coalesces concurrent LLM requests into small batches. Requests arriving
+within a short flush window are dispatched together over the shared HTTP
+connection pool, amortizing connection setup across prompts. A lone
+request bypasses the window entirely so uncontended latency is unchanged.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+class LLMRequestBatcher:
+    """Micro-batches concurrent requests to the LLM endpoint"""
+
+    def __init__(self,
+                 send: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+                 flush_interval: float = 0.02,
+                 max_batch: int = 8):
+        """
+        Initialize request batcher
+
+        Args:
+            send: Async callable that performs one API request
+            flush_interval: Seconds to wait for more requests before flushing
+            max_batch: Flush immediately once this many requests are pending
+        """
+        self._send = send
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush_handle = None
+        self._in_flight = 0
+
+    async def submit(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Submit a request payload, batching it with concurrent submissions
+
+        Args:
+            payload: Chat completion request payload
+
+        Returns:
+            API response for this payload
+        """
+        # Fast path: no observed concurrency, send immediately without
+        # paying the flush-window latency
+        if self._in_flight == 0 and not self._pending:
+            self._in_flight += 1
+            try:
+                return await self._send(payload)
+            finally:
+                self._in_flight -= 1
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((payload, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.flush_interval, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Dispatch all pending requests as one concurrent batch"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.ensure_future(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """
+        Run a batch of requests concurrently and resolve their futures
+
+        Args:
+            batch: Pending (payload, future) pairs to dispatch
+        """
+        self._in_flight += len(batch)
+        try:
+            results = await asyncio.gather(
+                *(self._send(payload) for payload, _ in batch),
+                return_exceptions=True
+            )
+            for (_, future), result in zip(batch, results):
+                if future.cancelled():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            self._in_flight -= len(batch)
@@ -6,6 +6,7 @@ Orchestrates all LLM components and provides a unified interface for LLM interac
 
 from typing import Dict, Any, List, Optional
 from .api_connector import APIConnector
+from .exceptions import RateLimitError
 from .prompt_manager import PromptManager
 from .validator import ResponseValidator
 
@@ -67,6 +68,8 @@ class MistralClient:
             
             return response_text
             
+        except RateLimitError:
+            raise
         except Exception as e:
             raise Exception(f"Failed to generate response: {str(e)}")
     
@@ -104,15 +107,31 @@ class MistralClient:
         Returns:
             Generated response text with reference numbers
         """
+        prompt = self._build_references_prompt(question, context_chunks)
+
+        # Generate response
+        return self.generate_response(prompt, max_tokens=max_tokens)
+
+    def _build_references_prompt(self, question: str, context_chunks: List[str]) -> str:
+        """
+        Build the RAG prompt with numbered references
+
+        Args:
+            question: User's question
+            context_chunks: List of context chunks
+
+        Returns:
+            Formatted prompt with reference instructions
+        """
         # Format context chunks with reference numbers
         context_parts = []
         for i, chunk in enumerate(context_chunks, 1):
             context_parts.append(f"[Reference {i}]: {chunk}")
-        
+
         context = "\n\n".join(context_parts)
-        
+
         # Create RAG prompt with reference instructions
-        prompt = f"""
+        return f"""
         Answer the following question based on the provided context. When you use information from the context, include the reference number in superscript format (e.g., ¹, ², ³).
 
         Question: {question}
@@ -129,10 +148,7 @@ class MistralClient:
 
         Answer:
         """
-        
-        # Generate response
-        return self.generate_response(prompt, max_tokens=max_tokens)
-    
+
     def generate_summary(self, content: str) -> str:
         """
         Generate summary response
@@ -0,0 +1,14 @@
+"""
+LLM Exceptions Module
+
+Typed exceptions for LLM API failures so callers can branch on failure
+mode instead of matching substrings of wrapped error messages.
+"""
+
+class LLMError(Exception):
+    """Base class for LLM API errors"""
+    pass
+
+class RateLimitError(LLMError):
+    """Raised when the API keeps returning 429 after all retries"""
+    pass
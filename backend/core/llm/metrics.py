@@ -0,0 +1,79 @@
+"""
+LLM Metrics Module
+
+Prometheus instrumentation for LLM API calls: call latency, token
+throughput, in-flight request depth, and error counts. The helpers here
+keep metric bookkeeping out of the connectors' retry logic.
+"""
+
+import time
+from contextlib import contextmanager
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from .exceptions import RateLimitError
+
+# Call latency per model, including retries and backoff waits
+LLM_CALL_SECONDS = Histogram(
+    'llm_call_seconds',
+    'Wall-clock duration of LLM API calls',
+    ['model']
+)
+
+# Token throughput, taken from the API usage block of each response
+LLM_PROMPT_TOKENS = Counter(
+    'llm_prompt_tokens_total',
+    'Prompt tokens sent to the LLM API',
+    ['model']
+)
+LLM_COMPLETION_TOKENS = Counter(
+    'llm_completion_tokens_total',
+    'Completion tokens returned by the LLM API',
+    ['model']
+)
+
+# Queue depth: requests currently inside make_request
+LLM_INFLIGHT_REQUESTS = Gauge(
+    'llm_inflight_requests',
+    'LLM API requests currently in flight'
+)
+
+LLM_ERRORS_TOTAL = Counter(
+    'llm_errors_total',
+    'LLM API call failures by type',
+    ['type']
+)
+
+@contextmanager
+def track_call(model: str):
+    """
+    Track one LLM API call: in-flight depth, duration, and failures
+
+    Args:
+        model: Model name used for the call
+    """
+    LLM_INFLIGHT_REQUESTS.inc()
+    start = time.perf_counter()
+    try:
+        yield
+    except RateLimitError:
+        LLM_ERRORS_TOTAL.labels(type='rate_limit').inc()
+        raise
+    except Exception:
+        LLM_ERRORS_TOTAL.labels(type='error').inc()
+        raise
+    finally:
+        LLM_INFLIGHT_REQUESTS.dec()
+        LLM_CALL_SECONDS.labels(model=model).observe(time.perf_counter() - start)
+
+def record_usage(model: str, response: dict) -> None:
+    """
+    Record token usage from a successful API response
+
+    Args:
+        model: Model name used for the call
+        response: API response dictionary with a usage block
+    """
+    usage = response.get('usage', {})
+    LLM_PROMPT_TOKENS.labels(model=model).inc(usage.get('prompt_tokens', 0))
+    LLM_COMPLETION_TOKENS.labels(model=model).inc(usage.get('completion_tokens', 0))
@@ -5,8 +5,8 @@ Contains all API request models with minimal validation.
 Complex validation logic is handled by separate validator classes.
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, StringConstraints
+from typing import Annotated, Optional
 
 class FileUploadRequest(BaseModel):
     """Model for file upload requests"""
@@ -14,10 +14,14 @@ class FileUploadRequest(BaseModel):
 
 class QueryRequest(BaseModel):
     """Model for query requests with basic field validation"""
-    query: str = Field(
+    # Stripping at parse time makes whitespace-only queries fail the
+    # min_length check, so they are rejected with a 422 before any route
+    # code or pipeline dependency runs
+    query: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=1, max_length=2000)
+    ] = Field(
         ...,  # Required field
-        min_length=1,
-        max_length=2000,
         description="User query text"
     )
     
@@ -6,7 +6,7 @@ It includes PII detection, sensitive content filtering, and query optimization.
 """
 
 import re
-from typing import Dict
+from typing import Dict, Optional
 
 class QueryProcessor:
     """Handles query processing, transformation, and validation"""
@@ -39,18 +39,19 @@ class QueryProcessor:
         # Filler words to remove for better search
         self.filler_words = ['what is', 'what are', 'can you', 'please', 'tell me']
     
-    def transform_query(self, query: str) -> str:
+    def transform_query(self, query: str, query_lower: Optional[str] = None) -> str:
         """
         Transform query for better retrieval effectiveness
-        
+
         Args:
             query: Original user query
-            
+            query_lower: Pre-lowercased query (optional, computed if not provided)
+
         Returns:
             Transformed query optimized for search
         """
         # Remove common filler words that don't help with search
-        transformed = query.lower()
+        transformed = query_lower if query_lower is not None else query.lower()
         
         for filler in self.filler_words:
             transformed = transformed.replace(filler, ' ').strip()
@@ -69,17 +70,19 @@ class QueryProcessor:
         
         return transformed
     
-    def check_query_refusal(self, query: str) -> str:
+    def check_query_refusal(self, query: str, query_lower: Optional[str] = None) -> str:
         """
         Check if query should be refused due to sensitive content or PII
-        
+
         Args:
             query: User query to check
-            
+            query_lower: Pre-lowercased query (optional, computed if not provided)
+
         Returns:
             Refusal reason if query should be refused, empty string otherwise
         """
-        query_lower = query.lower()
+        if query_lower is None:
+            query_lower = query.lower()
         
         # Check for PII patterns
         for pii_type, pattern in self.pii_patterns.items():
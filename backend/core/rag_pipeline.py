@@ -8,13 +8,17 @@ This module orchestrates the complete RAG pipeline using modular components:
 - Response generation
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from models import QueryRequest, QueryResponse, ChunkInfo
 from .search import SearchEngine
-from .llm import MistralClient
+from .llm import AsyncMistralClient
 from .intent_detector import IntentDetector
 from .query_processor import QueryProcessor
 from .response_generator import ResponseGenerator
+from .semantic_cache import SemanticQueryCache
+from config import settings
+import asyncio
+import json
 import time
 
 class RAGPipeline:
@@ -23,13 +27,21 @@ class RAGPipeline:
     def __init__(self):
         # Initialize core components
         self.search_engine = SearchEngine()
-        self.llm_client = MistralClient()
+        self.llm_client = AsyncMistralClient()  # Superset of MistralClient with async methods
         
         # Initialize modular components
         self.intent_detector = IntentDetector()
         self.query_processor = QueryProcessor()
         self.response_generator = ResponseGenerator(self.llm_client, self.search_engine)
         
+        # Near-duplicate queries reuse the full response instead of
+        # re-running search and the LLM
+        self.semantic_cache = SemanticQueryCache(
+            similarity_threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+            max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.SEMANTIC_CACHE_TTL_SECONDS
+        )
+        
         # Query processing configuration
         self.min_similarity_threshold = 0.1  # Lowered for testing
         self.max_context_chunks = 5
@@ -44,11 +56,15 @@ class RAGPipeline:
         Returns:
             QueryResponse with answer and metadata
         """
-        start_time = time.time()
-        
+        start_time = time.perf_counter()
+
         try:
+            # Lowercase the query once and share it across detection, refusal
+            # checks, and transformation to avoid repeated string allocations
+            query_lower = request.query.lower()
+
             # Step 1: Intent detection and validation
-            intent, refusal_reason = self._detect_intent_and_validate(request)
+            intent, refusal_reason = self._detect_intent_and_validate(request, query_lower)
             if refusal_reason:
                 return self._create_refusal_response(refusal_reason)
             
@@ -58,23 +74,133 @@ class RAGPipeline:
                 return simple_response
             
             # Step 3: Process complex queries
-            return self._process_complex_query(request, intent, start_time)
-            
-        except Exception as e:
+            return self._process_complex_query(request, intent, start_time, query_lower)
+
+        except Exception:
+            # Truly unexpected failures only; expected failure modes return
+            # explicit error responses from the helpers above
             return self._create_error_response(start_time)
     
-    def _detect_intent_and_validate(self, request: QueryRequest) -> Tuple[str, Optional[str]]:
+    async def stream_query(self, request: QueryRequest) -> AsyncIterator[str]:
         """
-        Detect intent and validate query for sensitive content
+        Stream a query response as Server-Sent Event frames
+
+        The retrieved chunks go out as soon as search finishes —
+        milliseconds into the request — and the answer follows as
+        {"delta": token} frames while the LLM is still generating, so
+        time-to-first-byte is retrieval latency instead of the full
+        pipeline. A final frame carries the response metadata.
+
+        Args:
+            request: Query request object
+
+        Yields:
+            SSE-formatted frames ("data: {...}\n\n")
+        """
+        start_time = time.perf_counter()
+        query_lower = request.query.lower()
+
+        intent, refusal_reason = self._detect_intent_and_validate(request, query_lower)
+        if refusal_reason:
+            yield self._sse_frame({'error': f"I cannot answer this query: {refusal_reason}"})
+            return
+
+        # Simple and specialized intents have no token stream to forward;
+        # replay the finished answer as one delta so clients handle every
+        # intent through the same frame protocol
+        simple_response = await asyncio.to_thread(self._handle_simple_intents, intent, request)
+        if simple_response:
+            yield self._sse_frame({'delta': simple_response.answer})
+            yield self._sse_frame({
+                'done': True,
+                'chunks': [chunk.model_dump(mode='json') for chunk in simple_response.chunks],
+                'processing_time': time.perf_counter() - start_time,
+                'intent': intent
+            })
+            return
+
+        transformed_query = self.query_processor.transform_query(request.query, query_lower)
+        validation_result = self._validate_search_engine_state()
+        if not validation_result['is_valid']:
+            yield self._sse_frame({'error': validation_result['message']})
+            return
+
+        # Retrieval is CPU-bound; keep it off the event loop
+        search_results = await asyncio.to_thread(
+            self.search_engine.search, transformed_query,
+            top_k=self.max_context_chunks, threshold=self.min_similarity_threshold
+        )
+        if not search_results or not self._validate_search_scores(search_results):
+            yield self._sse_frame({
+                'error': "I don't have enough information to answer this question based on my knowledge base."
+            })
+            return
+
+        top_results = search_results[:3]
+        response_chunks = [result.chunk for result in top_results]
+
+        # The sources are known the moment retrieval finishes; send them
+        # ahead of the answer so the client can render them immediately
+        yield self._sse_frame({
+            'chunks': [chunk.model_dump(mode='json') for chunk in response_chunks],
+            'search_score': search_results[0].score
+        })
+
+        context_chunks = [chunk.content for chunk in response_chunks]
+        async for token in self.llm_client.astream_rag_response_with_references(
+            transformed_query, context_chunks
+        ):
+            yield self._sse_frame({'delta': token})
+
+        yield self._sse_frame({
+            'done': True,
+            'processing_time': time.perf_counter() - start_time,
+            'intent': intent
+        })
+
+    @staticmethod
+    def _sse_frame(payload: dict) -> str:
+        """Format a payload as a Server-Sent Event frame"""
+        return f"data: {json.dumps(payload)}\n\n"
+
+    def try_simple_intent_response_json(self, request: QueryRequest) -> Optional[bytes]:
+        """
+        Fast path: pre-encoded JSON for simple intents
+        
+        Returns the cached JSON response body when the query resolves to a
+        simple intent and is not refused, letting the route skip Pydantic
+        serialization entirely. Returns None when full processing is needed.
         
         Args:
             request: Query request object
             
+        Returns:
+            JSON-encoded response bytes, or None
+        """
+        query_lower = request.query.lower()
+        intent = self.intent_detector.detect_intent(request.query, query_lower)
+        if not self.intent_detector.is_simple_intent(intent):
+            return None
+        
+        # Refusals take priority over simple intents; defer to process_query
+        if self.query_processor.check_query_refusal(request.query, query_lower):
+            return None
+        
+        return self.response_generator.simple_intent_generator.generate_simple_intent_response_json(intent)
+    
+    def _detect_intent_and_validate(self, request: QueryRequest, query_lower: Optional[str] = None) -> Tuple[str, Optional[str]]:
+        """
+        Detect intent and validate query for sensitive content
+
+        Args:
+            request: Query request object
+            query_lower: Pre-lowercased query (optional, computed if not provided)
+
         Returns:
             Tuple of (intent, refusal_reason)
         """
-        intent = self.intent_detector.detect_intent(request.query)
-        refusal_reason = self.query_processor.check_query_refusal(request.query)
+        intent = self.intent_detector.detect_intent(request.query, query_lower)
+        refusal_reason = self.query_processor.check_query_refusal(request.query, query_lower)
         return intent, refusal_reason
     
     def _create_refusal_response(self, refusal_reason: str) -> QueryResponse:
@@ -108,37 +234,54 @@ class RAGPipeline:
         
         return None  # Needs complex processing
     
-    def _process_complex_query(self, request: QueryRequest, intent: str, start_time: float) -> QueryResponse:
+    def _process_complex_query(self, request: QueryRequest, intent: str, start_time: float, query_lower: Optional[str] = None) -> QueryResponse:
         """
         Process complex queries that require search and LLM generation
-        
+
         Args:
             request: Query request object
             intent: Detected intent
             start_time: Start time for processing
-            
+            query_lower: Pre-lowercased query (optional, computed if not provided)
+
         Returns:
             QueryResponse with generated answer
         """
-        try:
-            # Step 1: Transform query
-            transformed_query = self.query_processor.transform_query(request.query)
-            
-            # Step 2: Validate search engine state
-            validation_result = self._validate_search_engine_state()
-            if not validation_result['is_valid']:
-                return self._create_error_response(start_time, validation_result['message'])
-            
-            # Step 3: Perform search
-            search_results = self.search_engine.search(transformed_query, top_k=self.max_context_chunks, threshold=self.min_similarity_threshold)
-            if not search_results:
-                return self._handle_no_search_results(transformed_query, intent, start_time)
-            
-            # Step 4: Process search results
-            return self._process_search_results(search_results, transformed_query, intent, start_time)
-            
-        except Exception as e:
-            raise
+        # Step 1: Transform query
+        transformed_query = self.query_processor.transform_query(request.query, query_lower)
+
+        # Step 2: Validate search engine state
+        validation_result = self._validate_search_engine_state()
+        if not validation_result['is_valid']:
+            return self._create_error_response(start_time, validation_result['message'])
+
+        # Step 3: Probe the semantic cache. Vectors are L2-normalized, so
+        # a near-duplicate of a recent query returns its cached response
+        # without search or an LLM call; the engine vectorizes under its
+        # index lock, so a concurrent ingest cannot expose a half-refit
+        # vectorizer here.
+        query_tokens = self.search_engine.preprocess_query(transformed_query)
+        query_vector = self.search_engine.vectorize_query(query_tokens)
+        # Keyed on generation as well as size: a corpus cleared and
+        # replaced by one of equal chunk count must not serve answers
+        # generated from the old documents
+        corpus_key = (self.search_engine.index_generation, len(self.search_engine.chunks))
+        if query_vector is not None and query_vector.nnz > 0:
+            cached_response = self.semantic_cache.get(query_vector, corpus_key)
+            if cached_response is not None:
+                return cached_response
+
+        # Step 4: Perform search
+        search_results = self.search_engine.search(transformed_query, top_k=self.max_context_chunks, threshold=self.min_similarity_threshold)
+        if not search_results:
+            return self._handle_no_search_results(transformed_query, intent, start_time)
+
+        # Step 5: Process search results; only fully generated responses
+        # are cached, not the no-result or error fallbacks
+        response = self._process_search_results(search_results, transformed_query, intent, start_time)
+        if query_vector is not None and query_vector.nnz > 0:
+            self.semantic_cache.put(query_vector, response, corpus_key)
+        return response
     
     def _validate_search_engine_state(self) -> Dict[str, Any]:
         """
@@ -193,19 +336,15 @@ class RAGPipeline:
         Returns:
             QueryResponse with generated answer
         """
-        try:
-            # Check similarity threshold
-            if not self._validate_search_scores(search_results):
-                return self._handle_low_similarity_fallback(transformed_query, intent, start_time)
-            
-            # Use search results directly (they're already ranked)
-            ranked_results = search_results
-            
-            # Generate response
-            return self._generate_final_response(ranked_results, transformed_query, intent, start_time)
-            
-        except Exception as e:
-            raise
+        # Check similarity threshold
+        if not self._validate_search_scores(search_results):
+            return self._handle_low_similarity_fallback(transformed_query, intent, start_time)
+
+        # Use search results directly (they're already ranked)
+        ranked_results = search_results
+
+        # Generate response
+        return self._generate_final_response(ranked_results, transformed_query, intent, start_time)
     
     def _validate_search_scores(self, search_results: List) -> bool:
         """
@@ -246,7 +385,7 @@ class RAGPipeline:
             return QueryResponse(
                 answer=answer,
                 chunks=fallback_chunks,
-                processing_time=time.time() - start_time,
+                processing_time=time.perf_counter() - start_time,
                 confidence_score=0.5,  # Lower confidence for fallback,
                 intent=intent
             )
@@ -269,52 +408,46 @@ class RAGPipeline:
         Returns:
             QueryResponse with final answer
         """
-        try:
-            # Prepare context for LLM with reference numbers
-            context_chunks = [result.chunk.content for result in ranked_results[:3]]
-
-            # Create reference mapping
-            reference_mapping = {}
-            for i, result in enumerate(ranked_results[:3], 1):
-                reference_mapping[i] = result.chunk
-
-            # Generate response with references
-            answer = self.llm_client.generate_rag_response_with_references(
-                transformed_query,
-                context_chunks,
-                reference_mapping
-            )
-            
-            # Validate response
-            validation = self.llm_client.validate_response_quality(answer)
-            
-            # Prepare chunks for response
-            response_chunks = [result.chunk for result in ranked_results[:3]]
-            
-            processing_time = time.time() - start_time
-            
-            # Prepare metadata
-            metadata = {
-                "intent": intent,
-                "transformed_query": transformed_query,
-                "total_search_results": len(ranked_results),
-                "validation_issues": validation.get("issues", []),
-                "validation_confidence": validation.get("confidence", 0.0)
-            }
-            
-            return QueryResponse(
-                answer=answer,
-                chunks=response_chunks,
-                processing_time=processing_time,
-                confidence_score=validation.get("confidence", 0.0),
-                intent=intent,
-                search_score=ranked_results[0].score if ranked_results else 0.0,
-                metadata=metadata,
-                reference_mapping=reference_mapping
-            )
-            
-        except Exception as e:
-            raise
+        # Slice the top results once and reuse the chunk list for context,
+        # reference mapping, and the response payload
+        top_results = ranked_results[:3]
+        response_chunks = [result.chunk for result in top_results]
+        context_chunks = [chunk.content for chunk in response_chunks]
+
+        # Create reference mapping
+        reference_mapping = {i: chunk for i, chunk in enumerate(response_chunks, 1)}
+
+        # Generate response with references
+        answer = self.llm_client.generate_rag_response_with_references(
+            transformed_query,
+            context_chunks,
+            reference_mapping
+        )
+
+        # Validate response
+        validation = self.llm_client.validate_response_quality(answer)
+
+        processing_time = time.perf_counter() - start_time
+
+        # Prepare metadata
+        metadata = {
+            "intent": intent,
+            "transformed_query": transformed_query,
+            "total_search_results": len(ranked_results),
+            "validation_issues": validation.get("issues", []),
+            "validation_confidence": validation.get("confidence", 0.0)
+        }
+
+        return QueryResponse(
+            answer=answer,
+            chunks=response_chunks,
+            processing_time=processing_time,
+            confidence_score=validation.get("confidence", 0.0),
+            intent=intent,
+            search_score=ranked_results[0].score if ranked_results else 0.0,
+            metadata=metadata,
+            reference_mapping=reference_mapping
+        )
     
     def _create_error_response(self, start_time: float, message: str = None) -> QueryResponse:
         """
@@ -327,7 +460,7 @@ class RAGPipeline:
         Returns:
             QueryResponse with error message
         """
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         error_message = message or "An error occurred while processing your query. Please try again."
         
         return QueryResponse(
@@ -9,10 +9,13 @@ from .base_generator import BaseResponseGenerator
 from .simple_intents import SimpleIntentGenerator
 from .summary_generator import SummaryGenerator
 from .data_extraction import DataExtractionGenerator
+from .response_cache import ResponseCache, response_cache
 
 __all__ = [
     'BaseResponseGenerator',
     'SimpleIntentGenerator', 
     'SummaryGenerator',
-    'DataExtractionGenerator'
+    'DataExtractionGenerator',
+    'ResponseCache',
+    'response_cache'
 ]
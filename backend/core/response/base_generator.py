@@ -4,11 +4,34 @@ Base Response Generator
 Provides common functionality and interfaces for all response generators.
 """
 
+import asyncio
+import io
+import time
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, List
+from config import settings
 from models import QueryRequest, QueryResponse, ChunkInfo
 from ..llm import MistralClient
 from ..search import SearchEngine
+from .response_cache import response_cache
+
+# Version of the generator prompt set. Bump when any prompt template changes
+# so response/prompt caches keyed on it invalidate correctly.
+PROMPT_VERSION = "v1"
+
+class _RequestTimer:
+    """Elapsed-time tracker backed by the monotonic performance counter"""
+    
+    __slots__ = ('_start', 'elapsed')
+    
+    def __init__(self):
+        self._start = time.perf_counter()
+        self.elapsed = 0.0
+    
+    def stop(self) -> None:
+        self.elapsed = time.perf_counter() - self._start
 
 class BaseResponseGenerator(ABC):
     """Base class for all response generators"""
@@ -16,6 +39,20 @@ class BaseResponseGenerator(ABC):
     def __init__(self, llm_client: MistralClient, search_engine: SearchEngine):
         self.llm_client = llm_client
         self.search_engine = search_engine
+        
+        # Map-reduce configuration: contexts larger than this are split into
+        # per-chunk LLM calls (matches the client-side prompt truncation limit)
+        self.map_reduce_char_threshold = 3000
+        self.max_concurrent_requests = 8
+        
+        # Shared content-addressable cache of generated responses
+        self.response_cache = response_cache
+        
+        # Memoized context strings keyed by chunk-id tuple. Chunk ids are
+        # UUIDs whose content never changes, so entries never go stale;
+        # oldest entries are evicted once the cache is full.
+        self._context_cache = {}
+        self._context_cache_maxsize = 64
     
     def check_documents_available(self) -> bool:
         """Check if documents are available for processing"""
@@ -32,10 +69,73 @@ class BaseResponseGenerator(ABC):
         return self.search_engine.chunks[:limit]
     
     def format_context_from_chunks(self, chunks: List[ChunkInfo]) -> str:
-        """Format chunks into context string"""
+        """Format chunks into context string, memoized per chunk set"""
         if not chunks:
             return ""
-        return "\n\n".join([f"Document {chunk.document_id}: {chunk.content}" for chunk in chunks])
+        
+        cache_key = tuple(str(chunk.id) for chunk in chunks)
+        context = self._context_cache.get(cache_key)
+        if context is not None:
+            return context
+        
+        # Single pass over the chunks; avoids materializing a list of
+        # per-chunk f-strings before the join
+        buf = io.StringIO()
+        for i, chunk in enumerate(chunks):
+            if i:
+                buf.write("\n\n")
+            buf.write("Document ")
+            buf.write(str(chunk.document_id))
+            buf.write(": ")
+            buf.write(chunk.content)
+        context = buf.getvalue()
+        
+        if len(self._context_cache) >= self._context_cache_maxsize:
+            self._context_cache.pop(next(iter(self._context_cache)))
+        self._context_cache[cache_key] = context
+        return context
+    
+    def _pack_chunks_by_budget(self, chunks: List[ChunkInfo], max_tokens: int = 6000) -> List[ChunkInfo]:
+        """
+        Greedily keep chunks until the estimated token budget is hit
+
+        Keeps the prompt inside the model context window so the API never
+        truncates server-side (or errors into the generic fallback). Token
+        counts are estimated with the fast ~4-chars-per-token heuristic;
+        chunks arrive already ranked, so truncation drops the least
+        valuable ones. The first chunk is always kept.
+
+        Args:
+            chunks: Ranked chunks to pack
+            max_tokens: Estimated token budget for the chunk content
+
+        Returns:
+            Leading slice of chunks that fits the budget
+        """
+        packed = []
+        used_tokens = 0
+        for chunk in chunks:
+            chunk_tokens = len(chunk.content) // 4
+            if packed and used_tokens + chunk_tokens > max_tokens:
+                break
+            packed.append(chunk)
+            used_tokens += chunk_tokens
+        return packed
+
+    @contextmanager
+    def _timed(self):
+        """
+        Time a request with the monotonic clock
+        
+        Yields a timer whose .elapsed is populated on exit, so every return
+        path (including error responses) can carry a real processing time
+        unaffected by wall-clock (NTP) jumps.
+        """
+        timer = _RequestTimer()
+        try:
+            yield timer
+        finally:
+            timer.stop()
     
     def create_error_response(self, message: str, intent: str = "error") -> QueryResponse:
         """Create a standardized error response"""
@@ -47,6 +147,64 @@ class BaseResponseGenerator(ABC):
             intent=intent
         )
     
+    def make_cache_key(self, chunks: List[ChunkInfo], namespace: str) -> str:
+        """
+        Build the response cache key for a chunk set
+        
+        Args:
+            chunks: Chunks the response is generated from
+            namespace: Response type discriminator (e.g. 'summary')
+            
+        Returns:
+            Hex digest cache key
+        """
+        return self.response_cache.make_key(chunks, namespace, PROMPT_VERSION, settings.MODEL_NAME)
+    
+    def should_map_reduce(self, chunks: List[ChunkInfo]) -> bool:
+        """Check if chunks are large enough to warrant per-chunk map-reduce"""
+        if len(chunks) <= 1:
+            return False
+        return sum(len(chunk.content) for chunk in chunks) > self.map_reduce_char_threshold
+    
+    async def map_chunks(self, chunks: List[ChunkInfo], prompt_builder: Callable[[List[ChunkInfo]], str]) -> List[str]:
+        """
+        Run one LLM call per chunk concurrently and collect partial results
+        
+        Wall-clock time becomes max(chunk_latency) instead of the latency of
+        one oversized call; a semaphore bounds in-flight requests.
+        
+        Args:
+            chunks: List of document chunks to map over
+            prompt_builder: Builds a prompt from a (single-chunk) chunk list
+            
+        Returns:
+            List of partial LLM results, one per chunk
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        async def generate_partial(chunk: ChunkInfo) -> str:
+            async with semaphore:
+                return await self.llm_client.agenerate_response(prompt_builder([chunk]))
+        
+        return list(await asyncio.gather(*(generate_partial(chunk) for chunk in chunks)))
+    
+    def map_chunks_sync(self, chunks: List[ChunkInfo], prompt_builder: Callable[[List[ChunkInfo]], str]) -> List[str]:
+        """
+        Synchronous fallback for map_chunks using a thread pool
+        
+        Args:
+            chunks: List of document chunks to map over
+            prompt_builder: Builds a prompt from a (single-chunk) chunk list
+            
+        Returns:
+            List of partial LLM results, one per chunk
+        """
+        with ThreadPoolExecutor(max_workers=min(len(chunks), 5)) as executor:
+            return list(executor.map(
+                lambda chunk: self.llm_client.generate_response(prompt_builder([chunk])),
+                chunks
+            ))
+    
     @abstractmethod
     def generate_response(self, request: QueryRequest) -> QueryResponse:
         """Generate response for the given request"""
@@ -4,11 +4,38 @@ Data Extraction Response Generator
 Handles generation of data extraction responses for document content.
 """
 
-import time
 from typing import List
 from models import QueryRequest, QueryResponse, ChunkInfo
 from .base_generator import BaseResponseGenerator
 
+# Static instruction text hoisted to module level and placed ahead of the
+# dynamic context so provider-side prompt caches can reuse the prefix.
+EXTRACTION_INSTRUCTIONS = """Please extract and organize the key data from the document content below.
+Focus on identifying and structuring the most important information.
+
+Provide a well-structured data extraction with:
+1. **Main Categories/Data Types** found in the document
+2. **Key Data Points** organized by category
+3. **Specific Details** with clear formatting
+4. **Structured Lists** or tables where appropriate
+
+Format the response in a clear, organized manner that makes it easy to read and understand.
+Use bullet points, numbered lists, or tables as appropriate for the data type."""
+
+EXTRACTION_REDUCE_INSTRUCTIONS = """The partial data extractions below cover different sections of the same document.
+Merge them into one organized extraction, de-duplicating repeated data points.
+
+Provide a well-structured data extraction with:
+1. **Main Categories/Data Types** found in the document
+2. **Key Data Points** organized by category
+3. **Specific Details** with clear formatting
+4. **Structured Lists** or tables where appropriate"""
+
+# Full static prefixes precomputed at import so each prompt build is a
+# single string concatenation
+_EXTRACTION_PREFIX = EXTRACTION_INSTRUCTIONS + "\n\nDocument Content:\n"
+_EXTRACTION_REDUCE_PREFIX = EXTRACTION_REDUCE_INSTRUCTIONS + "\n\nPartial Extractions:\n"
+
 class DataExtractionGenerator(BaseResponseGenerator):
     """Handles data extraction request processing"""
     
@@ -26,8 +53,16 @@ class DataExtractionGenerator(BaseResponseGenerator):
         Returns:
             QueryResponse with extracted data in structured format
         """
-        start_time = time.time()
+        with self._timed() as timer:
+            response = self._generate_extraction_response(request)
         
+        # Assigned after the timed block so every path, including error
+        # responses, carries real timing
+        response.processing_time = timer.elapsed
+        return response
+    
+    def _generate_extraction_response(self, request: QueryRequest) -> QueryResponse:
+        """Build the extraction response; processing_time is set by the caller"""
         try:
             # Check prerequisites
             if not self.check_documents_available():
@@ -42,65 +77,166 @@ class DataExtractionGenerator(BaseResponseGenerator):
                     intent='data_extraction'
                 )
             
-            # Get chunks for data extraction
-            chunks = self.get_available_chunks(self.extraction_chunk_limit)
+            # Get chunks for data extraction (shared precomputed view)
+            chunks = self.search_engine.extraction_view
             
             # Generate data extraction
             extraction_response = self._generate_extraction_content(chunks)
             
-            # Calculate processing time
-            processing_time = time.time() - start_time
-            
             return QueryResponse(
                 answer=extraction_response,
                 chunks=chunks,
-                processing_time=processing_time,
                 confidence_score=0.9,  # High confidence for data extraction
                 intent='data_extraction'
             )
             
-        except Exception as e:
+        except Exception:
             # Fallback to simple response if data extraction fails
             return self.create_error_response(
                 "I encountered an error while extracting data. Please try again or ask a more specific question about the document content.",
                 intent='data_extraction'
             )
+
+    async def agenerate_response(self, request: QueryRequest) -> QueryResponse:
+        """
+        Generate data extraction response without blocking the event loop
+
+        Async variant of generate_response for use under an ASGI server;
+        the LLM call is awaited so concurrent requests can overlap.
+
+        Args:
+            request: Query request object
+
+        Returns:
+            QueryResponse with extracted data in structured format
+        """
+        with self._timed() as timer:
+            response = await self._agenerate_extraction_response(request)
+
+        # Assigned after the timed block so every path, including error
+        # responses, carries real timing
+        response.processing_time = timer.elapsed
+        return response
+
+    async def _agenerate_extraction_response(self, request: QueryRequest) -> QueryResponse:
+        """Async extraction response build; processing_time is set by the caller"""
+        try:
+            # Check prerequisites
+            if not self.check_documents_available():
+                return self.create_error_response(
+                    "No documents have been uploaded yet. Please upload some PDF documents first so I can extract data.",
+                    intent='data_extraction'
+                )
+
+            if not self.check_search_engine_initialized():
+                return self.create_error_response(
+                    "Search engine not properly initialized. Please try uploading the document again.",
+                    intent='data_extraction'
+                )
+
+            # Get chunks for data extraction (shared precomputed view)
+            chunks = self.search_engine.extraction_view
+
+            # Generate data extraction
+            extraction_response = await self._agenerate_extraction_content(chunks)
+
+            return QueryResponse(
+                answer=extraction_response,
+                chunks=chunks,
+                confidence_score=0.9,  # High confidence for data extraction
+                intent='data_extraction'
+            )
+
+        except Exception:
+            # Fallback to simple response if data extraction fails
+            return self.create_error_response(
+                "I encountered an error while extracting data. Please try again or ask a more specific question about the document content.",
+                intent='data_extraction'
+            )
+
     
+    def _build_extraction_prompt(self, chunks: List[ChunkInfo]) -> str:
+        """
+        Build the data extraction prompt for the given chunks
+
+        Static instructions come first and the document content last, so the
+        instruction prefix stays byte-identical across requests.
+
+        Args:
+            chunks: List of document chunks
+
+        Returns:
+            Formatted data extraction prompt
+        """
+        return _EXTRACTION_PREFIX + self.format_context_from_chunks(self._pack_chunks_by_budget(chunks))
+
+    def _build_reduce_prompt(self, partial_extractions: List[str]) -> str:
+        """
+        Build the prompt that merges per-chunk partial extractions
+
+        Args:
+            partial_extractions: Partial extractions produced by the map phase
+
+        Returns:
+            Formatted reduce prompt
+        """
+        return _EXTRACTION_REDUCE_PREFIX + "\n\n---\n\n".join(partial_extractions)
+
     def _generate_extraction_content(self, chunks: List[ChunkInfo]) -> str:
         """
         Generate data extraction content from chunks
         
+        Large contexts are map-reduced: each chunk is extracted in its own
+        LLM call (run on a thread pool) and the partials are merged with a
+        short reduce call, instead of truncating one oversized prompt.
+        
         Args:
             chunks: List of document chunks
             
         Returns:
             Generated data extraction text
         """
-        # Prepare context for data extraction
-        context = self.format_context_from_chunks(chunks)
+        cache_key = self.make_cache_key(chunks, 'extraction')
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        # Create specialized data extraction prompt
-        extraction_prompt = f"""
-        Please extract and organize the key data from the following document content.
-        Focus on identifying and structuring the most important information.
+        if self.should_map_reduce(chunks):
+            partial_extractions = self.map_chunks_sync(chunks, self._build_extraction_prompt)
+            extraction = self.llm_client.generate_response(self._build_reduce_prompt(partial_extractions))
+        else:
+            # Generate data extraction using LLM
+            extraction = self.llm_client.generate_response(self._build_extraction_prompt(chunks))
         
-        Document Content:
-        {context}
-        
-        Please provide a well-structured data extraction with:
-        1. **Main Categories/Data Types** found in the document
-        2. **Key Data Points** organized by category
-        3. **Specific Details** with clear formatting
-        4. **Structured Lists** or tables where appropriate
-        
-        Format the response in a clear, organized manner that makes it easy to read and understand.
-        Use bullet points, numbered lists, or tables as appropriate for the data type.
-        
-        Extracted Data:
+        self.response_cache.set(cache_key, extraction)
+        return extraction
+
+    async def _agenerate_extraction_content(self, chunks: List[ChunkInfo]) -> str:
+        """
+        Async variant of _generate_extraction_content
+
+        The map phase runs per-chunk calls concurrently with asyncio.gather,
+        so wall-clock time is bounded by the slowest chunk, not the sum.
+
+        Args:
+            chunks: List of document chunks
+
+        Returns:
+            Generated data extraction text
         """
+        cache_key = self.make_cache_key(chunks, 'extraction')
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        if self.should_map_reduce(chunks):
+            partial_extractions = await self.map_chunks(chunks, self._build_extraction_prompt)
+            extraction = await self.llm_client.agenerate_response(self._build_reduce_prompt(partial_extractions))
+        else:
+            extraction = await self.llm_client.agenerate_response(self._build_extraction_prompt(chunks))
         
-        # Generate data extraction using LLM
-        return self.llm_client.generate_response(extraction_prompt)
+        self.response_cache.set(cache_key, extraction)
+        return extraction
     
     def process_data_extraction_request(self, request: QueryRequest) -> QueryResponse:
         """
@@ -113,3 +249,15 @@ class DataExtractionGenerator(BaseResponseGenerator):
             QueryResponse with extracted data in structured format
         """
         return self.generate_response(request)
+
+    async def aprocess_data_extraction_request(self, request: QueryRequest) -> QueryResponse:
+        """
+        Process data extraction requests without blocking the event loop
+
+        Args:
+            request: Query request object
+
+        Returns:
+            QueryResponse with extracted data in structured format
+        """
+        return await self.agenerate_response(request)
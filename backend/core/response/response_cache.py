@@ -0,0 +1,121 @@
+"""
+Response Cache Module
+
+Content-addressable cache for generated LLM responses. Summary and data
+extraction outputs are deterministic functions of the chunk set, prompt
+version, and model, so repeated requests over the same document can skip
+the model invocation entirely at the cost of one hash lookup.
+"""
+
+import hashlib
+import os
+import sqlite3
+import struct
+import threading
+import time
+from typing import List, Optional
+
+from config import settings
+from models import ChunkInfo
+
+class ResponseCache:
+    """SQLite-backed cache of generated responses keyed by content hash"""
+
+    def __init__(self, db_path: Optional[str] = None, ttl_seconds: int = 7 * 24 * 60 * 60):
+        """
+        Initialize response cache
+
+        Args:
+            db_path: Path to the SQLite database file (defaults to DATA_DIR)
+            ttl_seconds: Time-to-live for cached entries (default 7 days)
+        """
+        self.db_path = db_path or os.path.join(settings.DATA_DIR, "response_cache.db")
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, "
+            "value TEXT NOT NULL, "
+            "created_at REAL NOT NULL)"
+        )
+        self._connection.commit()
+
+    def make_key(self, chunks: List[ChunkInfo], namespace: str, prompt_version: str, model_id: str) -> str:
+        """
+        Build a content-addressable cache key for a chunk set
+
+        Each chunk content is hashed with an 8-byte length prefix so that
+        different chunk boundaries over the same concatenated text cannot
+        collide. The namespace, prompt version, and model id are folded in
+        so a prompt or model change invalidates old entries.
+
+        Args:
+            chunks: Chunks the response was generated from
+            namespace: Response type discriminator (e.g. 'summary')
+            prompt_version: Current prompt template version
+            model_id: Model the response was generated with
+
+        Returns:
+            Hex digest cache key
+        """
+        hasher = hashlib.sha256()
+        for chunk in chunks:
+            content = chunk.content.encode("utf-8")
+            hasher.update(struct.pack(">Q", len(content)))
+            hasher.update(content)
+        hasher.update(namespace.encode("utf-8"))
+        hasher.update(prompt_version.encode("utf-8"))
+        hasher.update(model_id.encode("utf-8"))
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached response text, or None on miss or expiry
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            value, created_at = row
+            if time.time() - created_at > self.ttl_seconds:
+                # Expired entry - drop it and report a miss
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._connection.commit()
+                return None
+
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a generated response
+
+        Args:
+            key: Cache key from make_key
+            value: Response text to cache
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, time.time())
+            )
+            self._connection.commit()
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+# Global cache instance shared by all response generators
+response_cache = ResponseCache()
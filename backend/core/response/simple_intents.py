@@ -4,29 +4,51 @@ Simple Intent Response Generator
 Handles generation of responses for simple intents like greetings, thanks, commands, etc.
 """
 
-from typing import Dict
+import orjson
+from types import MappingProxyType
+from typing import Mapping
 from models import QueryRequest, QueryResponse
 from .base_generator import BaseResponseGenerator
 
+# Response templates shared by all generator instances; built once per
+# process and wrapped read-only so they cannot be mutated accidentally
+_RESPONSE_TEMPLATES: Mapping[str, str] = MappingProxyType({
+    'greeting': "Hello! I'm here to help you with questions about your documents. Feel free to ask me anything!",
+    'thanks': "You're welcome! I'm glad I could help. Let me know if you have any other questions!",
+    'command': "I understand you've given me a command. I'm designed to answer questions about your documents. Could you please rephrase that as a question?",
+    'document_command': "For document management, use the file upload interface above. I can help you analyze the content once it's uploaded.",
+    'system_command': "I'll start fresh. Please upload your documents again and I'll be ready to help.",
+    'unclear': "I'm not sure what you're asking. Could you please rephrase your question? For example: 'What is this document about?' or 'Summarize the key points.'",
+    'out_of_scope': "I'm designed to help with questions about your uploaded documents. Please ask me about the content in your knowledge base.",
+    'default': "I'm here to help! Please ask me a question about your documents."
+})
+
+# One QueryResponse per intent, validated once at import; simple-intent
+# responses are constant so the same instance is returned on every call
+_PREBUILT_RESPONSES: Mapping[str, QueryResponse] = MappingProxyType({
+    intent: QueryResponse(
+        answer=text,
+        chunks=[],  # No chunks for simple intents
+        processing_time=0.0,  # No processing time for simple responses
+        confidence_score=1.0,  # High confidence for simple responses
+        intent=intent
+    )
+    for intent, text in _RESPONSE_TEMPLATES.items()
+})
+
+# Pre-encoded JSON for each prebuilt response so the router can skip
+# Pydantic serialization entirely on the simple-intent fast path
+_PREBUILT_JSON: Mapping[str, bytes] = MappingProxyType({
+    intent: orjson.dumps(response.model_dump())
+    for intent, response in _PREBUILT_RESPONSES.items()
+})
+
 class SimpleIntentGenerator(BaseResponseGenerator):
     """Handles simple intent responses"""
     
     def __init__(self, llm_client, search_engine):
         super().__init__(llm_client, search_engine)
-        self._response_templates = self._initialize_response_templates()
-    
-    def _initialize_response_templates(self) -> Dict[str, str]:
-        """Initialize response templates for different intents"""
-        return {
-            'greeting': "Hello! I'm here to help you with questions about your documents. Feel free to ask me anything!",
-            'thanks': "You're welcome! I'm glad I could help. Let me know if you have any other questions!",
-            'command': "I understand you've given me a command. I'm designed to answer questions about your documents. Could you please rephrase that as a question?",
-            'document_command': "For document management, use the file upload interface above. I can help you analyze the content once it's uploaded.",
-            'system_command': "I'll start fresh. Please upload your documents again and I'll be ready to help.",
-            'unclear': "I'm not sure what you're asking. Could you please rephrase your question? For example: 'What is this document about?' or 'Summarize the key points.'",
-            'out_of_scope': "I'm designed to help with questions about your uploaded documents. Please ask me about the content in your knowledge base.",
-            'default': "I'm here to help! Please ask me a question about your documents."
-        }
+        self._response_templates = _RESPONSE_TEMPLATES
     
     def generate_response(self, request: QueryRequest) -> QueryResponse:
         """
@@ -41,16 +63,7 @@ class SimpleIntentGenerator(BaseResponseGenerator):
         # Extract intent from request (assuming it's passed in the request or determined elsewhere)
         intent = getattr(request, 'intent', 'default')
         
-        # Get response template
-        response_text = self._response_templates.get(intent, self._response_templates['default'])
-        
-        return QueryResponse(
-            answer=response_text,
-            chunks=[],  # No chunks for simple intents
-            processing_time=0.0,  # No processing time for simple responses
-            confidence_score=1.0,  # High confidence for simple responses
-            intent=intent
-        )
+        return self._get_prebuilt_response(intent)
     
     def generate_simple_intent_response(self, intent: str, original_query: str) -> QueryResponse:
         """
@@ -63,13 +76,39 @@ class SimpleIntentGenerator(BaseResponseGenerator):
         Returns:
             QueryResponse with appropriate short response
         """
-        # Get response template directly
-        response_text = self._response_templates.get(intent, self._response_templates['default'])
+        return self._get_prebuilt_response(intent)
+    
+    def generate_simple_intent_response_json(self, intent: str) -> bytes:
+        """
+        Get the pre-encoded JSON response body for a simple intent
+        
+        Args:
+            intent: Detected intent
+            
+        Returns:
+            JSON-encoded response bytes
+        """
+        return _PREBUILT_JSON.get(intent, _PREBUILT_JSON['default'])
+    
+    def _get_prebuilt_response(self, intent: str) -> QueryResponse:
+        """
+        Look up the shared prebuilt response for an intent
+        
+        Args:
+            intent: Detected intent
+            
+        Returns:
+            Shared QueryResponse instance for the intent
+        """
+        response = _PREBUILT_RESPONSES.get(intent)
+        if response is not None:
+            return response
         
+        # Unknown intent: build a one-off response so the intent field is preserved
         return QueryResponse(
-            answer=response_text,
-            chunks=[],  # No chunks for simple intents
-            processing_time=0.0,  # No processing time for simple responses
-            confidence_score=1.0,  # High confidence for simple responses
+            answer=_RESPONSE_TEMPLATES['default'],
+            chunks=[],
+            processing_time=0.0,
+            confidence_score=1.0,
             intent=intent
         )
@@ -4,10 +4,37 @@ Summary Response Generator
 Handles generation of summary responses for document content.
 """
 
+import json
 import time
-from typing import List
+from typing import AsyncIterator, List
 from models import QueryRequest, QueryResponse, ChunkInfo
 from .base_generator import BaseResponseGenerator
+from ..llm import RateLimitError
+
+# Static instruction text hoisted to module level and placed ahead of the
+# dynamic context so provider-side prompt caches can reuse the prefix.
+SUMMARY_INSTRUCTIONS = """Please provide a comprehensive summary of the document content below.
+Focus on the key points, main themes, and essential information.
+
+Provide a well-structured summary with:
+1. Main topic/theme
+2. Key points (bullet points)
+3. Important details
+4. Overall conclusion or takeaway"""
+
+SUMMARY_REDUCE_INSTRUCTIONS = """The partial summaries below cover different sections of the same document.
+Combine them into one coherent, comprehensive summary.
+
+Provide a well-structured summary with:
+1. Main topic/theme
+2. Key points (bullet points)
+3. Important details
+4. Overall conclusion or takeaway"""
+
+# Full static prefixes precomputed at import so each prompt build is a
+# single string concatenation
+_SUMMARY_PREFIX = SUMMARY_INSTRUCTIONS + "\n\nDocument Content:\n"
+_SUMMARY_REDUCE_PREFIX = SUMMARY_REDUCE_INSTRUCTIONS + "\n\nPartial Summaries:\n"
 
 class SummaryGenerator(BaseResponseGenerator):
     """Handles summary request processing"""
@@ -26,8 +53,16 @@ class SummaryGenerator(BaseResponseGenerator):
         Returns:
             QueryResponse with summary and relevant chunks
         """
-        start_time = time.time()
+        with self._timed() as timer:
+            response = self._generate_summary_response(request)
         
+        # Assigned after the timed block so every path, including error
+        # responses, carries real timing
+        response.processing_time = timer.elapsed
+        return response
+    
+    def _generate_summary_response(self, request: QueryRequest) -> QueryResponse:
+        """Build the summary response; processing_time is set by the caller"""
         try:
             # Check prerequisites
             if not self.check_documents_available():
@@ -42,74 +77,235 @@ class SummaryGenerator(BaseResponseGenerator):
                     intent='summary_request'
                 )
             
-            # Get chunks for summary
-            chunks = self.get_available_chunks(self.summary_chunk_limit)
+            # Get chunks for summary (shared precomputed view)
+            chunks = self.search_engine.summary_view
             
             # Generate summary
             summary_response = self._generate_summary_content(chunks)
             
-            # Calculate processing time
-            processing_time = time.time() - start_time
-            
             return QueryResponse(
                 answer=summary_response,
                 chunks=chunks,
-                processing_time=processing_time,
                 confidence_score=0.9,  # High confidence for summary
                 intent='summary_request'
             )
             
-        except Exception as e:
+        except RateLimitError:
+            return self.create_error_response(
+                "I'm currently experiencing high demand. Please wait a moment and try again, or ask a more specific question about your documents.",
+                intent='summary_request'
+            )
+        except Exception:
             # Fallback to simple response if summary generation fails
-            # Check if it's a rate limit error
-            if "rate limit" in str(e).lower():
+            return self.create_error_response(
+                "I encountered an error while generating the summary. Please try again or ask a more specific question about the document content.",
+                intent='summary_request'
+            )
+
+    async def agenerate_response(self, request: QueryRequest) -> QueryResponse:
+        """
+        Generate summary response without blocking the event loop
+
+        Async variant of generate_response for use under an ASGI server;
+        the LLM call is awaited so concurrent requests can overlap.
+
+        Args:
+            request: Query request object
+
+        Returns:
+            QueryResponse with summary and relevant chunks
+        """
+        with self._timed() as timer:
+            response = await self._agenerate_summary_response(request)
+
+        # Assigned after the timed block so every path, including error
+        # responses, carries real timing
+        response.processing_time = timer.elapsed
+        return response
+
+    async def _agenerate_summary_response(self, request: QueryRequest) -> QueryResponse:
+        """Async summary response build; processing_time is set by the caller"""
+        try:
+            # Check prerequisites
+            if not self.check_documents_available():
                 return self.create_error_response(
-                    "I'm currently experiencing high demand. Please wait a moment and try again, or ask a more specific question about your documents.",
+                    "No documents have been uploaded yet. Please upload some PDF documents first so I can provide a summary.",
                     intent='summary_request'
                 )
-            else:
+
+            if not self.check_search_engine_initialized():
                 return self.create_error_response(
-                    "I encountered an error while generating the summary. Please try again or ask a more specific question about the document content.",
+                    "Search engine not properly initialized. Please try uploading the document again.",
                     intent='summary_request'
                 )
+
+            # Get chunks for summary (shared precomputed view)
+            chunks = self.search_engine.summary_view
+
+            # Generate summary
+            summary_response = await self._agenerate_summary_content(chunks)
+
+            return QueryResponse(
+                answer=summary_response,
+                chunks=chunks,
+                confidence_score=0.9,  # High confidence for summary
+                intent='summary_request'
+            )
+
+        except RateLimitError:
+            return self.create_error_response(
+                "I'm currently experiencing high demand. Please wait a moment and try again, or ask a more specific question about your documents.",
+                intent='summary_request'
+            )
+        except Exception:
+            # Fallback to simple response if summary generation fails
+            return self.create_error_response(
+                "I encountered an error while generating the summary. Please try again or ask a more specific question about the document content.",
+                intent='summary_request'
+            )
+
     
+    def _build_summary_prompt(self, chunks: List[ChunkInfo]) -> str:
+        """
+        Build the summary prompt for the given chunks
+
+        Static instructions come first and the document content last, so the
+        instruction prefix stays byte-identical across requests.
+
+        Args:
+            chunks: List of document chunks
+
+        Returns:
+            Formatted summary prompt
+        """
+        return _SUMMARY_PREFIX + self.format_context_from_chunks(self._pack_chunks_by_budget(chunks))
+
+    async def stream_response(self, request: QueryRequest) -> AsyncIterator[str]:
+        """
+        Stream a summary back as Server-Sent Event frames
+
+        Tokens are forwarded as {"delta": token} frames while the LLM is
+        still generating, so time-to-first-token replaces the full
+        completion wait. A final frame carries the response metadata.
+
+        Args:
+            request: Query request object
+
+        Yields:
+            SSE-formatted frames ("data: {...}\n\n")
+        """
+        start_time = time.perf_counter()
+
+        # Check prerequisites
+        if not self.check_documents_available():
+            yield self._sse_frame({
+                'error': "No documents have been uploaded yet. Please upload some PDF documents first so I can provide a summary."
+            })
+            return
+
+        if not self.check_search_engine_initialized():
+            yield self._sse_frame({
+                'error': "Search engine not properly initialized. Please try uploading the document again."
+            })
+            return
+
+        chunks = self.search_engine.summary_view
+
+        # Cached responses are replayed as a single delta frame
+        cache_key = self.make_cache_key(chunks, 'summary')
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            yield self._sse_frame({'delta': cached})
+            summary = cached
+        else:
+            parts = []
+            async for token in self.llm_client.astream_response(self._build_summary_prompt(chunks)):
+                parts.append(token)
+                yield self._sse_frame({'delta': token})
+            summary = ''.join(parts)
+            self.response_cache.set(cache_key, summary)
+
+        # Final frame with response metadata
+        yield self._sse_frame({
+            'done': True,
+            'chunks': [chunk.model_dump(mode='json') for chunk in chunks],
+            'processing_time': time.perf_counter() - start_time,
+            'confidence_score': 0.9,
+            'intent': 'summary_request'
+        })
+
+    @staticmethod
+    def _sse_frame(payload: dict) -> str:
+        """Format a payload as a Server-Sent Event frame"""
+        return f"data: {json.dumps(payload)}\n\n"
+
+    def _build_reduce_prompt(self, partial_summaries: List[str]) -> str:
+        """
+        Build the prompt that combines per-chunk partial summaries
+
+        Args:
+            partial_summaries: Partial summaries produced by the map phase
+
+        Returns:
+            Formatted reduce prompt
+        """
+        return _SUMMARY_REDUCE_PREFIX + "\n\n---\n\n".join(partial_summaries)
+
     def _generate_summary_content(self, chunks: List[ChunkInfo]) -> str:
         """
         Generate summary content from chunks
         
+        Large contexts are map-reduced: each chunk is summarized in its own
+        LLM call (run on a thread pool) and the partials are combined with a
+        short reduce call, instead of truncating one oversized prompt.
+        
         Args:
             chunks: List of document chunks
             
         Returns:
             Generated summary text
         """
-        try:
-            # Prepare context for summary
-            context = self.format_context_from_chunks(chunks)
-            
-            # Create specialized summary prompt
-            summary_prompt = f"""
-            Please provide a comprehensive summary of the following document content. 
-            Focus on the key points, main themes, and essential information.
-            
-            Document Content:
-            {context}
-            
-            Please provide a well-structured summary with:
-            1. Main topic/theme
-            2. Key points (bullet points)
-            3. Important details
-            4. Overall conclusion or takeaway
-            
-            Summary:
-            """
-            
+        cache_key = self.make_cache_key(chunks, 'summary')
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        if self.should_map_reduce(chunks):
+            partial_summaries = self.map_chunks_sync(chunks, self._build_summary_prompt)
+            summary = self.llm_client.generate_response(self._build_reduce_prompt(partial_summaries))
+        else:
             # Generate summary using LLM
-            result = self.llm_client.generate_response(summary_prompt)
-            return result
-            
-        except Exception as e:
-            raise
+            summary = self.llm_client.generate_response(self._build_summary_prompt(chunks))
+        
+        self.response_cache.set(cache_key, summary)
+        return summary
+
+    async def _agenerate_summary_content(self, chunks: List[ChunkInfo]) -> str:
+        """
+        Async variant of _generate_summary_content
+
+        The map phase runs per-chunk calls concurrently with asyncio.gather,
+        so wall-clock time is bounded by the slowest chunk, not the sum.
+
+        Args:
+            chunks: List of document chunks
+
+        Returns:
+            Generated summary text
+        """
+        cache_key = self.make_cache_key(chunks, 'summary')
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        if self.should_map_reduce(chunks):
+            partial_summaries = await self.map_chunks(chunks, self._build_summary_prompt)
+            summary = await self.llm_client.agenerate_response(self._build_reduce_prompt(partial_summaries))
+        else:
+            summary = await self.llm_client.agenerate_response(self._build_summary_prompt(chunks))
+        
+        self.response_cache.set(cache_key, summary)
+        return summary
     
     def process_summary_request(self, request: QueryRequest) -> QueryResponse:
         """
@@ -122,3 +318,15 @@ class SummaryGenerator(BaseResponseGenerator):
             QueryResponse with summary and relevant chunks
         """
         return self.generate_response(request)
+
+    async def aprocess_summary_request(self, request: QueryRequest) -> QueryResponse:
+        """
+        Process summary requests without blocking the event loop
+
+        Args:
+            request: Query request object
+
+        Returns:
+            QueryResponse with summary and relevant chunks
+        """
+        return await self.agenerate_response(request)
@@ -54,11 +54,47 @@ class ResponseGenerator:
     def process_data_extraction_request(self, request: QueryRequest) -> QueryResponse:
         """
         Process data extraction requests with specialized handling
-        
+
         Args:
             request: Query request object
-            
+
         Returns:
             QueryResponse with extracted data in structured format
         """
         return self.data_extraction_generator.process_data_extraction_request(request)
+
+    def stream_summary_request(self, request: QueryRequest):
+        """
+        Stream a summary response as Server-Sent Event frames
+
+        Args:
+            request: Query request object
+
+        Returns:
+            Async iterator of SSE-formatted frames
+        """
+        return self.summary_generator.stream_response(request)
+
+    async def aprocess_summary_request(self, request: QueryRequest) -> QueryResponse:
+        """
+        Process summary requests without blocking the event loop
+
+        Args:
+            request: Query request object
+
+        Returns:
+            QueryResponse with summary and relevant chunks
+        """
+        return await self.summary_generator.aprocess_summary_request(request)
+
+    async def aprocess_data_extraction_request(self, request: QueryRequest) -> QueryResponse:
+        """
+        Process data extraction requests without blocking the event loop
+
+        Args:
+            request: Query request object
+
+        Returns:
+            QueryResponse with extracted data in structured format
+        """
+        return await self.data_extraction_generator.aprocess_data_extraction_request(request)
@@ -7,6 +7,35 @@ Handles text cleaning, tokenization, and normalization for search processing.
 import re
 from typing import List, Set
 
+# Compiled once at import; this runs for every chunk during indexing and
+# every query, so per-call re.compile lookups add up
+_WS_RE = re.compile(r'\s+')
+
+# Single-pass translation table: lowercases ASCII letters and maps every
+# other character to a space, fusing what used to be separate lower() and
+# regex substitution passes
+class _TokenTranslationTable(dict):
+    """Translate mapping that sends unmapped codepoints to a space
+
+    The explicit entries cover ASCII; __missing__ catches everything
+    above, matching the old [^a-zA-Z\\s] regex which replaced all
+    non-ASCII characters with spaces. Without it, accented letters would
+    pass through untouched — and uppercased ones unlowered — so the same
+    word would tokenize differently between indexed text and queries.
+    """
+
+    def __missing__(self, code):
+        return ' '
+
+_TOKEN_TABLE = _TokenTranslationTable(str.maketrans({
+    chr(c): (
+        chr(c + 32) if 65 <= c <= 90
+        else chr(c) if 97 <= c <= 122 or chr(c).isspace()
+        else ' '
+    )
+    for c in range(128)
+}))
+
 class TextPreprocessor:
     """Handles text preprocessing for search algorithms"""
     
@@ -15,15 +44,16 @@ class TextPreprocessor:
         self.min_word_length = 3
         self.max_vocabulary_size = 10000
         
-        # Common stop words to filter out
-        self.stop_words = {
+        # Common stop words to filter out (frozenset: immutable, and the
+        # membership check in preprocess_text takes the tighter C path)
+        self.stop_words = frozenset({
             'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
             'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
             'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
             'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these',
             'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him',
             'her', 'us', 'them', 'my', 'your', 'his', 'her', 'its', 'our', 'their'
-        }
+        })
     
     def preprocess_text(self, text: str) -> List[str]:
         """
@@ -35,24 +65,12 @@ class TextPreprocessor:
         Returns:
             List of cleaned tokens
         """
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters and numbers, keep only letters and spaces
-        text = re.sub(r'[^a-zA-Z\s]', ' ', text)
-        
-        # Split into words and filter
-        words = text.split()
-        
-        # Filter words based on criteria
-        filtered_words = []
-        for word in words:
-            # Remove stop words and short words
-            if (len(word) >= self.min_word_length and 
-                word not in self.stop_words):
-                filtered_words.append(word)
-        
-        return filtered_words
+        # Lowercase and strip punctuation/numbers in a single translate
+        # pass, then drop stop words and short tokens in one comprehension
+        return [
+            word for word in text.translate(_TOKEN_TABLE).split()
+            if len(word) >= self.min_word_length and word not in self.stop_words
+        ]
     
     def extract_keywords(self, text: str, max_keywords: int = 10) -> List[str]:
         """
@@ -90,7 +108,7 @@ class TextPreprocessor:
         text = text.lower()
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         
         # Remove leading/trailing whitespace
         text = text.strip()
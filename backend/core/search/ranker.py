@@ -4,7 +4,9 @@ Search Ranker Module
 Handles result ranking, fusion, and re-ranking of search results.
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
+import ahocorasick
+import numpy as np
 from models import SearchResult, ChunkInfo
 
 class SearchRanker:
@@ -33,33 +35,38 @@ class SearchRanker:
         Returns:
             Fused results with hybrid scores
         """
-        # Create score dictionaries for easy lookup
-        tfidf_scores = dict(tfidf_results)
-        semantic_scores = dict(semantic_results)
+        if not tfidf_results and not semantic_results:
+            return []
         
-        # Get all unique chunk IDs
-        all_chunk_ids = set(tfidf_scores.keys()) | set(semantic_scores.keys())
+        # Weight each engine's scores, then combine per chunk id in numpy:
+        # np.unique deduplicates the ids and return_inverse maps every
+        # entry onto its slot for a single scattered add
+        ids = np.array(
+            [chunk_id for chunk_id, _ in tfidf_results] +
+            [chunk_id for chunk_id, _ in semantic_results]
+        )
+        weighted_scores = np.concatenate([
+            self.tfidf_weight * np.fromiter(
+                (score for _, score in tfidf_results), dtype=np.float64, count=len(tfidf_results)
+            ),
+            self.semantic_weight * np.fromiter(
+                (score for _, score in semantic_results), dtype=np.float64, count=len(semantic_results)
+            )
+        ])
         
-        # Calculate hybrid scores
-        hybrid_results = []
-        for chunk_id in all_chunk_ids:
-            tfidf_score = tfidf_scores.get(chunk_id, 0.0)
-            semantic_score = semantic_scores.get(chunk_id, 0.0)
-            
-            # Weighted combination
-            hybrid_score = (self.tfidf_weight * tfidf_score + 
-                          self.semantic_weight * semantic_score)
-            
-            hybrid_results.append((chunk_id, hybrid_score))
+        all_ids, inverse = np.unique(ids, return_inverse=True)
+        hybrid_scores = np.zeros(len(all_ids))
+        np.add.at(hybrid_scores, inverse, weighted_scores)
         
-        # Sort by hybrid score
-        hybrid_results.sort(key=lambda x: x[1], reverse=True)
-        return hybrid_results
+        # Order by hybrid score
+        order = np.argsort(-hybrid_scores, kind='stable')
+        return [(all_ids[i], float(hybrid_scores[i])) for i in order]
     
     def rank_results(self, 
                     results: List[Tuple[str, float]], 
                     chunks: List[ChunkInfo],
-                    query: str) -> List[Tuple[str, float]]:
+                    query: str,
+                    content_lower: Optional[Dict[str, str]] = None) -> List[Tuple[str, float]]:
         """
         Re-rank results based on additional factors
         
@@ -67,6 +74,8 @@ class SearchRanker:
             results: Initial search results
             chunks: All available chunks
             query: Original search query
+            content_lower: Lowercased content per chunk id, precomputed at
+                index time (optional, computed per chunk if not provided)
             
         Returns:
             Re-ranked results
@@ -77,6 +86,11 @@ class SearchRanker:
         # Create chunk lookup
         chunk_lookup = {chunk.id: chunk for chunk in chunks}
         
+        # Lowercase the query and build the multi-pattern matcher once per
+        # query instead of once per (result, word) pair
+        query_lower = query.lower()
+        automaton = self._build_query_automaton(query_lower)
+        
         # Apply re-ranking adjustments
         reranked_results = []
         for i, (chunk_id, score) in enumerate(results):
@@ -84,15 +98,18 @@ class SearchRanker:
             if not chunk:
                 continue
             
+            # Reuse the index-time lowercased content when available and
+            # share it across both boosts
+            chunk_lower = content_lower.get(chunk_id) if content_lower else None
+            if chunk_lower is None:
+                chunk_lower = chunk.content.lower()
+            
             # Start with original score
             adjusted_score = score
             
-            # Apply keyword boost
-            keyword_boost = self._calculate_keyword_boost(chunk.content, query)
+            # Both boosts come out of one scan over the content
+            keyword_boost, exact_match_boost = self._calculate_boosts(chunk_lower, automaton)
             adjusted_score *= keyword_boost
-            
-            # Apply exact match boost
-            exact_match_boost = self._calculate_exact_match_boost(chunk.content, query)
             adjusted_score *= exact_match_boost
             
             # Apply position penalty (later results get slight penalty)
@@ -102,52 +119,85 @@ class SearchRanker:
             reranked_results.append((chunk_id, adjusted_score))
         
         # Sort by adjusted scores
-        reranked_results.sort(key=lambda x: x[1], reverse=True)
-        return reranked_results
+        return self._sort_by_score(reranked_results)
     
-    def _calculate_keyword_boost(self, content: str, query: str) -> float:
+    def _build_query_automaton(self, query_lower: str) -> Optional[ahocorasick.Automaton]:
         """
-        Calculate keyword boost based on query terms in content
+        Build an Aho-Corasick automaton over the query words
+        
+        One automaton scans each chunk in a single pass, replacing one
+        substring search per query word.
         
         Args:
-            content: Chunk content
-            query: Search query
+            query_lower: Lowercased search query
             
         Returns:
-            Boost multiplier
+            Compiled automaton, or None for an empty query
         """
-        content_lower = content.lower()
-        query_lower = query.lower()
+        query_words = set(query_lower.split())
+        if not query_words:
+            return None
         
-        # Count query words in content
-        query_words = query_lower.split()
-        matches = sum(1 for word in query_words if word in content_lower)
+        # Each pattern is tagged with whether it counts as a query word,
+        # the exact phrase, or both (single-word queries), so one scan can
+        # feed both boosts
+        patterns = {word: [word, True, False] for word in query_words}
+        phrase = patterns.setdefault(query_lower, [query_lower, False, False])
+        phrase[2] = True
         
-        if matches == 0:
-            return 1.0
-        
-        # Boost based on number of matches
-        return self.keyword_boost ** matches
+        automaton = ahocorasick.Automaton()
+        for pattern, tags in patterns.items():
+            automaton.add_word(pattern, tuple(tags))
+        automaton.make_automaton()
+        return automaton
     
-    def _calculate_exact_match_boost(self, content: str, query: str) -> float:
+    def _calculate_boosts(self, content_lower: str, automaton: Optional[ahocorasick.Automaton]) -> Tuple[float, float]:
         """
-        Calculate exact match boost for query phrases
+        Calculate keyword and exact-match boosts in a single content scan
+        
+        The automaton carries the query words and the full phrase, so one
+        pass yields both the distinct-word count and the phrase hit;
+        matching keeps the original plain-substring semantics.
         
         Args:
-            content: Chunk content
-            query: Search query
+            content_lower: Lowercased chunk content
+            automaton: Query automaton from _build_query_automaton
             
         Returns:
-            Boost multiplier
+            (keyword boost, exact match boost) multipliers
         """
-        content_lower = content.lower()
-        query_lower = query.lower()
+        if automaton is None:
+            return 1.0, 1.0
+        
+        matched_words = set()
+        phrase_found = False
+        for _, (pattern, is_word, is_phrase) in automaton.iter(content_lower):
+            if is_word:
+                matched_words.add(pattern)
+            if is_phrase:
+                phrase_found = True
+        
+        # Boost based on number of distinct matched words
+        keyword_boost = self.keyword_boost ** len(matched_words) if matched_words else 1.0
+        exact_match_boost = self.exact_match_boost if phrase_found else 1.0
+        return keyword_boost, exact_match_boost
+    
+    @staticmethod
+    def _sort_by_score(results: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
+        """
+        Order (chunk_id, score) pairs by descending score via numpy
         
-        # Check for exact phrase match
-        if query_lower in content_lower:
-            return self.exact_match_boost
+        Args:
+            results: Scored results
+            
+        Returns:
+            Results in descending score order
+        """
+        if not results:
+            return []
         
-        return 1.0
+        scores = np.fromiter((score for _, score in results), dtype=np.float64, count=len(results))
+        return [results[i] for i in np.argsort(-scores, kind='stable')]
     
     def filter_by_threshold(self, 
                           results: List[Tuple[str, float]], 
@@ -5,6 +5,8 @@ Orchestrates all search components and provides a unified interface for search o
 """
 
 from typing import List, Dict, Any
+import threading
+from joblib import Parallel, delayed
 from .base_search import BaseSearchEngine
 from .tfidf_search import TFIDFSearch
 from .semantic_search import SemanticSearch
@@ -12,6 +14,18 @@ from .ranker import SearchRanker
 from .preprocessing import TextPreprocessor
 from models import ChunkInfo, SearchResult
 
+# Below this many chunks, tokenization stays serial: worker startup and
+# IPC would cost more than the tokenization itself
+_PARALLEL_TOKENIZE_MIN_CHUNKS = 200
+
+# Incremental adds transform against the vocabulary and IDF weights
+# frozen at the last fit, so words first seen in a later ingest score
+# zero. Refit when the corpus is still small enough that a rebuild is
+# cheap, or when enough of the incoming token mass falls outside the
+# fitted vocabulary that the frozen index would miss the new content.
+_FULL_REBUILD_MAX_CHUNKS = 2000
+_REBUILD_OOV_RATIO = 0.2
+
 class SearchEngine(BaseSearchEngine):
     """Main search engine that orchestrates TF-IDF, semantic search, and ranking"""
     
@@ -24,22 +38,54 @@ class SearchEngine(BaseSearchEngine):
         
         # Store chunks for reference
         self.chunks = []
-    
+        
+        # Lowercased chunk content, computed once at index time so the
+        # ranker does not re-lowercase every chunk on every query
+        self._content_lower = {}
+        
+        # Read-only leading-chunk views consumed by the response generators;
+        # rebuilt whenever the chunk list changes so request handlers return
+        # a shared tuple instead of slicing a fresh list copy per call
+        self.summary_view_size = 10
+        self.extraction_view_size = 15
+        self.summary_view = ()
+        self.extraction_view = ()
+
+        # Queries run on worker threads while ingest mutates the index
+        # (refitting the vectorizer in place, re-assigning matrices,
+        # extending the chunk list), so searches and mutations take this
+        # lock to never observe a half-rebuilt index. Re-entrant because
+        # add_chunks falls back to build_index.
+        self._index_lock = threading.RLock()
+
+        # Bumped on every rebuild or clear; consumers key derived state
+        # (like cached responses) on it, so replacing the corpus with one
+        # of equal size still invalidates them
+        self.index_generation = 0
+
     def build_index(self, chunks: List[ChunkInfo]) -> None:
         """
         Build search index from chunks
-        
+
         Args:
             chunks: List of chunks to index
         """
-        self.chunks = chunks
-        
-        # Build TF-IDF index
-        self.tfidf_search.build_tf_idf_vectors(chunks)
-        
-        # Build semantic index
-        self.semantic_search.build_semantic_index(chunks)
-    
+        # Tokenize outside the lock: preprocessing is pure and is the
+        # expensive part of a build, so searches stay unblocked for it
+        tokenized = self._tokenize_chunks(chunks)
+
+        with self._index_lock:
+            self.index_generation += 1
+            self.chunks = chunks
+            self._refresh_views()
+            self._content_lower = {chunk.id: chunk.content.lower() for chunk in chunks}
+
+            # Build TF-IDF index
+            self.tfidf_search.build_tf_idf_vectors(chunks, tokenized)
+
+            # Build semantic index
+            self.semantic_search.build_semantic_index(chunks, tokenized)
+
     def search(self, query: str, top_k: int = 5, threshold: float = 0.1) -> List[SearchResult]:
         """
         Search for relevant chunks given a query
@@ -52,52 +98,143 @@ class SearchEngine(BaseSearchEngine):
         Returns:
             List of search results
         """
-        if not self.chunks:
-            return []
-        
-        # Perform TF-IDF search
-        tfidf_results = self.tfidf_search.search(query, top_k=top_k * 2)
-        
-        # Perform semantic search
-        semantic_results = self.semantic_search.search(query, top_k=top_k * 2)
-        
-        # Fuse results
-        fused_results = self.ranker.fuse_results(tfidf_results, semantic_results)
-        
-        # Apply threshold filtering
-        filtered_results = self.ranker.filter_by_threshold(fused_results, threshold)
-        
-        # Re-rank results
-        reranked_results = self.ranker.rank_results(filtered_results, self.chunks, query)
-        
-        # Limit results
-        final_results = self.ranker.limit_results(reranked_results, top_k)
-        
-        # Convert to SearchResult objects
-        return self.ranker.create_search_results(final_results, self.chunks)
+        # Preprocess the query once and share the tokens with both engines
+        query_tokens = self.preprocessor.preprocess_text(query)
+
+        with self._index_lock:
+            if not self.chunks:
+                return []
+
+            # One candidate pool serves both engines: tokenization is shared,
+            # so any chunk either engine can score above zero shares a word
+            # with the query and sits in this posting-list union
+            candidates = self.semantic_search.candidate_rows(set(query_tokens))
+
+            # Perform TF-IDF search
+            tfidf_results = self.tfidf_search.search(
+                query, top_k=top_k * 2, query_tokens=query_tokens, candidate_rows=candidates
+            )
+
+            # Perform semantic search
+            semantic_results = self.semantic_search.search(
+                query, top_k=top_k * 2, query_tokens=query_tokens, candidate_rows=candidates
+            )
+
+            # Fuse results
+            fused_results = self.ranker.fuse_results(tfidf_results, semantic_results)
+
+            # Apply threshold filtering
+            filtered_results = self.ranker.filter_by_threshold(fused_results, threshold)
+
+            # Re-rank results
+            reranked_results = self.ranker.rank_results(filtered_results, self.chunks, query, self._content_lower)
+
+            # Limit results
+            final_results = self.ranker.limit_results(reranked_results, top_k)
+
+            # Convert to SearchResult objects
+            return self.ranker.create_search_results(final_results, self.chunks)
     
-    def add_chunks(self, chunks: List[ChunkInfo]) -> None:
+    def add_chunks(self, chunks: List[ChunkInfo]) -> bool:
         """
         Add new chunks to the existing index
-        
+
+        Incremental: new chunks are vectorized and appended to both indexes
+        in time linear in the added chunks; only the first ingest pays for a
+        full build. TF-IDF transforms against the vocabulary and IDF weights
+        from the last fit, so when the corpus is small or the new chunks
+        introduce substantial unseen vocabulary the whole index is refit
+        instead — otherwise documents on new topics would be unfindable.
+
         Args:
             chunks: New chunks to add
+
+        Returns:
+            True if the index was fully rebuilt, False for an incremental add
         """
-        # Add to existing chunks
-        self.chunks.extend(chunks)
+        # Tokenize the new chunks once, off-lock, and share with both
+        # indexes. The sub-engines hold the same chunk list object, so
+        # extending it keeps their row-to-chunk alignment intact.
+        tokenized = self._tokenize_chunks(chunks)
+
+        with self._index_lock:
+            # Full build when no index exists yet or the rebuild trigger fires
+            if self.tfidf_search.tf_idf_matrix is None or self._should_rebuild(chunks, tokenized):
+                self.chunks.extend(chunks)
+                self.build_index(self.chunks)
+                return True
+
+            self.tfidf_search.add_documents(chunks, tokenized)
+            self.semantic_search.add_documents(chunks, tokenized)
+            self.chunks.extend(chunks)
+            self._refresh_views()
+            self._content_lower.update((chunk.id, chunk.content.lower()) for chunk in chunks)
+            return False
+
+    def _should_rebuild(self, chunks: List[ChunkInfo], tokenized: List[List[str]]) -> bool:
+        """
+        Decide whether an ingest warrants refitting the whole index
+
+        Args:
+            chunks: New chunks being added
+            tokenized: Their token lists
+
+        Returns:
+            True when a full rebuild should replace the incremental add
+        """
+        # Small corpora refit every time: the rebuild costs less than the
+        # relevance lost to a frozen vocabulary
+        if len(self.chunks) + len(chunks) <= _FULL_REBUILD_MAX_CHUNKS:
+            return True
+
+        vocabulary = self.tfidf_search.vocabulary
+        total_tokens = sum(len(tokens) for tokens in tokenized)
+        if total_tokens == 0:
+            return False
+        oov_tokens = sum(
+            1 for tokens in tokenized for token in tokens if token not in vocabulary
+        )
+        return oov_tokens / total_tokens >= _REBUILD_OOV_RATIO
+    
+    def _tokenize_chunks(self, chunks: List[ChunkInfo]) -> List[List[str]]:
+        """
+        Tokenize chunk contents, in parallel for large ingests
+        
+        Tokenization is pure and per-chunk independent, so big builds are
+        farmed out across cores with joblib; small batches run serially.
         
-        # Rebuild indices with all chunks
-        self.build_index(self.chunks)
+        Args:
+            chunks: Chunks to tokenize
+            
+        Returns:
+            Token lists, one per chunk in order
+        """
+        if len(chunks) >= _PARALLEL_TOKENIZE_MIN_CHUNKS:
+            return Parallel(n_jobs=-1, batch_size='auto')(
+                delayed(self.preprocessor.preprocess_text)(chunk.content) for chunk in chunks
+            )
+        return [self.preprocessor.preprocess_text(chunk.content) for chunk in chunks]
+    
+    def _refresh_views(self) -> None:
+        """Rebuild the read-only leading-chunk views"""
+        self.summary_view = tuple(self.chunks[:self.summary_view_size])
+        self.extraction_view = tuple(self.chunks[:self.extraction_view_size])
     
     def clear_index(self) -> None:
-        """Clear all indexed data"""
-        self.chunks = []
-        self.tfidf_search.chunks = []
-        self.tfidf_search.tf_idf_vectors = {}
-        self.tfidf_search.vocabulary = {}
-        self.tfidf_search.idf_scores = {}
-        self.semantic_search.chunks = []
-        self.semantic_search.chunk_words = {}
+        """
+        Clear all indexed data
+
+        Fresh component instances drop every matrix and mapping in one
+        reference swap, so the old arrays are freed immediately and this
+        method stays decoupled from the engines' internal attributes.
+        """
+        with self._index_lock:
+            self.index_generation += 1
+            self.chunks = []
+            self._refresh_views()
+            self._content_lower = {}
+            self.tfidf_search = TFIDFSearch(self.preprocessor)
+            self.semantic_search = SemanticSearch(self.preprocessor)
     
     def get_index_stats(self) -> Dict[str, Any]:
         """
@@ -126,8 +263,9 @@ class SearchEngine(BaseSearchEngine):
         Returns:
             List of search results
         """
-        tfidf_results = self.tfidf_search.search(query, top_k)
-        return self.ranker.create_search_results(tfidf_results, self.chunks)
+        with self._index_lock:
+            tfidf_results = self.tfidf_search.search(query, top_k)
+            return self.ranker.create_search_results(tfidf_results, self.chunks)
     
     def search_semantic_only(self, query: str, top_k: int = 5) -> List[SearchResult]:
         """
@@ -140,8 +278,9 @@ class SearchEngine(BaseSearchEngine):
         Returns:
             List of search results
         """
-        semantic_results = self.semantic_search.search(query, top_k)
-        return self.ranker.create_search_results(semantic_results, self.chunks)
+        with self._index_lock:
+            semantic_results = self.semantic_search.search(query, top_k)
+            return self.ranker.create_search_results(semantic_results, self.chunks)
     
     def get_chunk_keywords(self, chunk_id: str) -> List[str]:
         """
@@ -167,6 +306,24 @@ class SearchEngine(BaseSearchEngine):
         """
         return self.preprocessor.preprocess_text(query)
     
+    def vectorize_query(self, query_tokens: List[str]):
+        """
+        Vectorize pre-tokenized query text against the fitted TF-IDF model
+
+        Taking the index lock here means callers can never hit the
+        vectorizer mid-refit during an ingest.
+
+        Args:
+            query_tokens: Preprocessed query tokens
+
+        Returns:
+            L2-normalized sparse query vector, or None if no index is built
+        """
+        with self._index_lock:
+            if self.tfidf_search.tf_idf_matrix is None:
+                return None
+            return self.tfidf_search.vectorizer.transform([query_tokens])
+
     def extract_keywords(self, text: str, max_keywords: int = 10) -> List[str]:
         """
         Extract important keywords from text
@@ -4,7 +4,9 @@ Semantic Search Module
 Implements semantic search using word overlap and Jaccard similarity.
 """
 
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Optional, Tuple, Set
+import numpy as np
+from scipy import sparse
 from .preprocessing import TextPreprocessor
 from models import ChunkInfo
 
@@ -15,29 +17,138 @@ class SemanticSearch:
         self.preprocessor = preprocessor
         self.chunks = []  # List of all chunks for search
         self.chunk_words = {}  # chunk_id -> set of words
+        self._total_words = 0  # running sum of word-set sizes, for stats
+
+        # Int-encoded CSR view of the word sets so search can compute
+        # Jaccard against every chunk with one sparse matrix-vector product
+        self.word_ids = {}  # word -> integer id
+        self._chunk_matrix = None  # binary CSR matrix (n_chunks x n_words)
+        self._chunk_sizes = None  # per-chunk word-set sizes
+        self._postings = {}  # word -> ndarray of chunk rows containing it
     
-    def build_semantic_index(self, chunks: List[ChunkInfo]) -> None:
+    def build_semantic_index(self, chunks: List[ChunkInfo], tokenized: Optional[List[List[str]]] = None) -> None:
         """
         Build semantic search index from chunks
-        
+
         Args:
             chunks: List of chunks to process
+            tokenized: Pre-tokenized chunk contents (optional, computed if not provided)
         """
         self.chunks = chunks
         self.chunk_words = {}
-        
-        # Preprocess all chunks and store word sets
+        self._total_words = 0
+
+        # Tokenize once unless the caller already did
+        if tokenized is None:
+            tokenized = [self.preprocessor.preprocess_text(chunk.content) for chunk in chunks]
+
+        # Store word sets per chunk, keeping the running total current so
+        # stats never re-walk every set
+        for chunk, words in zip(chunks, tokenized):
+            word_set = set(words)
+            self.chunk_words[chunk.id] = word_set
+            self._total_words += len(word_set)
+
+        # Encode the word sets as a binary CSR matrix over integer word ids
+        self.word_ids = {}
+        indices = []
+        indptr = [0]
         for chunk in chunks:
-            words = self.preprocessor.preprocess_text(chunk.content)
-            self.chunk_words[chunk.id] = set(words)
+            for word in self.chunk_words[chunk.id]:
+                indices.append(self.word_ids.setdefault(word, len(self.word_ids)))
+            indptr.append(len(indices))
+
+        self._chunk_matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(len(chunks), max(len(self.word_ids), 1))
+        )
+        self._chunk_sizes = np.diff(self._chunk_matrix.indptr)
+
+        # Posting lists (word -> rows containing it) let search skip chunks
+        # with zero query overlap entirely; read off the CSC column slices
+        csc = self._chunk_matrix.tocsc()
+        self._postings = {
+            word: csc.indices[csc.indptr[word_id]:csc.indptr[word_id + 1]]
+            for word, word_id in self.word_ids.items()
+        }
     
-    def search(self, query: str, top_k: int = 5) -> List[Tuple[str, float]]:
+    def add_documents(self, chunks: List[ChunkInfo], tokenized: Optional[List[List[str]]] = None) -> None:
+        """
+        Append new chunks to the index without a full rebuild
+
+        Extends the binary word matrix, the per-chunk sizes, and the
+        posting lists in time linear in the added chunks' word counts.
+
+        Args:
+            chunks: New chunks to append
+            tokenized: Pre-tokenized chunk contents (optional, computed if not provided)
+        """
+        if self._chunk_matrix is None:
+            raise ValueError("Cannot add documents before the index is built")
+
+        if tokenized is None:
+            tokenized = [self.preprocessor.preprocess_text(chunk.content) for chunk in chunks]
+
+        start_row = self._chunk_matrix.shape[0]
+        indices = []
+        indptr = [0]
+        new_postings = {}
+
+        for offset, (chunk, words) in enumerate(zip(chunks, tokenized)):
+            word_set = set(words)
+            self.chunk_words[chunk.id] = word_set
+            self._total_words += len(word_set)
+            for word in word_set:
+                indices.append(self.word_ids.setdefault(word, len(self.word_ids)))
+                new_postings.setdefault(word, []).append(start_row + offset)
+            indptr.append(len(indices))
+
+        # Grow the column space for words first seen in the new chunks,
+        # then stack the new rows onto the matrix
+        n_cols = max(len(self.word_ids), 1)
+        self._chunk_matrix.resize((start_row, n_cols))
+        new_rows = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(len(chunks), n_cols)
+        )
+        self._chunk_matrix = sparse.vstack([self._chunk_matrix, new_rows], format='csr')
+        self._chunk_sizes = np.diff(self._chunk_matrix.indptr)
+
+        for word, rows in new_postings.items():
+            rows_array = np.asarray(rows, dtype=np.int32)
+            existing = self._postings.get(word)
+            self._postings[word] = rows_array if existing is None else np.concatenate([existing, rows_array])
+
+    def candidate_rows(self, query_words: Set[str]) -> Optional[np.ndarray]:
+        """
+        Rows of chunks sharing at least one word with the query
+        
+        The union of the query words' posting lists. Tokenization is shared
+        across engines, so any chunk either engine can score above zero is
+        in this set — callers can use it as a common candidate pool.
+        
+        Args:
+            query_words: Preprocessed query words
+            
+        Returns:
+            Sorted unique row indices, or None when nothing overlaps
+        """
+        posting_lists = [self._postings[word] for word in query_words if word in self._postings]
+        if not posting_lists:
+            return None
+        return np.unique(np.concatenate(posting_lists))
+
+    def search(self, query: str, top_k: int = 5, query_tokens: Optional[List[str]] = None,
+               candidate_rows: Optional[np.ndarray] = None) -> List[Tuple[str, float]]:
         """
         Search for relevant chunks using semantic similarity
         
         Args:
             query: Search query
             top_k: Number of top results to return
+            query_tokens: Pre-tokenized query (optional, computed if not provided)
+            candidate_rows: Pre-built candidate pool from candidate_rows
+                (optional, computed if not provided)
             
         Returns:
             List of (chunk_id, score) tuples
@@ -45,25 +156,40 @@ class SemanticSearch:
         if not self.chunks or not self.chunk_words:
             return []
         
-        # Preprocess query
-        query_words = set(self.preprocessor.preprocess_text(query))
+        # Preprocess query unless the caller already did
+        if query_tokens is None:
+            query_tokens = self.preprocessor.preprocess_text(query)
+        query_words = set(query_tokens)
         
         if not query_words:
             return []
         
-        # Calculate similarities with all chunks
-        similarities = []
-        for chunk in self.chunks:
-            if chunk.id in self.chunk_words:
-                chunk_words = self.chunk_words[chunk.id]
-                
-                # Calculate Jaccard similarity
-                similarity = self._jaccard_similarity(query_words, chunk_words)
-                similarities.append((chunk.id, similarity))
-        
-        # Sort by similarity and return top_k results
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_k]
+        # Only chunks sharing at least one word with the query can score
+        # above zero, so everything else is skipped
+        if candidate_rows is None:
+            candidate_rows = self.candidate_rows(query_words)
+        if candidate_rows is None or len(candidate_rows) == 0:
+            return []
+
+        # One sparse matrix-vector product over the candidates gives their
+        # intersection sizes; Jaccard follows from
+        # |union| = |q| + |chunk| - |inter|
+        query_indicator = np.zeros(self._chunk_matrix.shape[1], dtype=np.int32)
+        known_ids = [self.word_ids[word] for word in query_words if word in self.word_ids]
+        query_indicator[known_ids] = 1
+
+        intersections = self._chunk_matrix[candidate_rows] @ query_indicator
+        unions = len(query_words) + self._chunk_sizes[candidate_rows] - intersections
+        scores = intersections / unions
+
+        # Partial top-k selection avoids sorting the full score array
+        if top_k < len(scores):
+            top_indices = np.argpartition(scores, -top_k)[-top_k:]
+        else:
+            top_indices = np.arange(len(scores))
+        top_indices = top_indices[np.argsort(scores[top_indices])[::-1]]
+
+        return [(self.chunks[candidate_rows[i]].id, float(scores[i])) for i in top_indices]
     
     def _jaccard_similarity(self, set1: Set[str], set2: Set[str]) -> float:
         """
@@ -160,5 +286,5 @@ class SemanticSearch:
         return {
             'chunks_count': len(self.chunks),
             'indexed_chunks': len(self.chunk_words),
-            'avg_words_per_chunk': sum(len(words) for words in self.chunk_words.values()) / len(self.chunk_words) if self.chunk_words else 0
+            'avg_words_per_chunk': self._total_words / len(self.chunk_words) if self.chunk_words else 0
         }
@@ -1,210 +1,150 @@
 """
 TF-IDF Search Module
 
-Implements TF-IDF (Term Frequency-Inverse Document Frequency) search algorithm.
+Implements TF-IDF (Term Frequency-Inverse Document Frequency) search on top
+of scikit-learn's TfidfVectorizer.
 """
 
-from typing import List, Dict, Tuple
-from collections import Counter
+from typing import List, Dict, Optional, Tuple
+import marisa_trie
 import numpy as np
-import math
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
 from .preprocessing import TextPreprocessor
 from models import ChunkInfo
 
 class TFIDFSearch:
     """TF-IDF search implementation"""
-    
+
     def __init__(self, preprocessor: TextPreprocessor):
         self.preprocessor = preprocessor
-        
+
+        # Vectorizer does vocabulary building, IDF weighting, and sparse
+        # vector assembly in tuned C instead of per-chunk Python loops. The
+        # identity analyzer means it consumes token lists produced by the
+        # shared preprocessor, so TF-IDF and semantic search stay consistent
+        # and each text is tokenized exactly once.
+        self.vectorizer = TfidfVectorizer(
+            analyzer=lambda tokens: tokens,
+            max_features=preprocessor.max_vocabulary_size,
+            norm='l2',
+            sublinear_tf=True,
+            # Ranking does not need double precision; float32 halves the
+            # corpus matrix and the memory traffic of the scoring matmul
+            dtype=np.float32
+        )
+
         # Core data structures for TF-IDF search
-        self.vocabulary = {}  # word -> index mapping
+        self.vocabulary = {}  # indexed words (marisa trie after build)
         self.idf_scores = {}  # word -> IDF score
-        self.tf_idf_vectors = {}  # chunk_id -> TF-IDF vector
+        self.tf_idf_vectors = {}  # chunk_id -> row index in tf_idf_matrix
+        self.tf_idf_matrix = None  # L2-normalized CSR matrix (n_chunks x vocab_size)
         self.chunks = []  # List of all chunks for search
-    
-    def calculate_tf(self, words: List[str]) -> Dict[str, float]:
-        """
-        Calculate Term Frequency for a document
-        
-        Args:
-            words: List of preprocessed words
-            
-        Returns:
-            Dictionary mapping words to their TF scores
-        """
-        if not words:
-            return {}
-        
-        # Count word occurrences
-        word_counts = Counter(words)
-        total_words = len(words)
-        
-        # Calculate TF: frequency of word / total words
-        tf_scores = {}
-        for word, count in word_counts.items():
-            tf_scores[word] = count / total_words
-            
-        return tf_scores
-    
-    def calculate_idf(self, documents: List[List[str]]) -> Dict[str, float]:
-        """
-        Calculate Inverse Document Frequency for vocabulary
-        
-        Args:
-            documents: List of documents, each as list of words
-            
-        Returns:
-            Dictionary mapping words to their IDF scores
-        """
-        if not documents:
-            return {}
-        
-        # Count documents containing each word
-        doc_count = Counter()
-        total_docs = len(documents)
-        
-        for doc in documents:
-            unique_words = set(doc)
-            for word in unique_words:
-                doc_count[word] += 1
-        
-        # Calculate IDF: log(total_docs / docs_containing_word)
-        idf_scores = {}
-        for word, count in doc_count.items():
-            idf_scores[word] = math.log(total_docs / count)
-            
-        return idf_scores
-    
-    def build_vocabulary(self, chunks: List[ChunkInfo]) -> None:
+
+    def build_tf_idf_vectors(self, chunks: List[ChunkInfo], tokenized: Optional[List[List[str]]] = None) -> None:
         """
-        Build vocabulary from all chunks
-        
+        Build TF-IDF vectors for all chunks
+
         Args:
             chunks: List of chunks to process
+            tokenized: Pre-tokenized chunk contents (optional; reused directly
+                by the vectorizer when provided, skipping re-tokenization)
         """
-        # Process all chunks to extract words
-        all_words = set()
-        for chunk in chunks:
-            words = self.preprocessor.preprocess_text(chunk.content)
-            all_words.update(words)
-        
-        # Build vocabulary mapping (word -> index)
-        self.vocabulary = {word: idx for idx, word in enumerate(sorted(all_words))}
-        
-        # Limit vocabulary size if needed
-        if len(self.vocabulary) > self.preprocessor.max_vocabulary_size:
-            # Keep most common words (simplified approach)
-            word_counts = Counter()
-            for chunk in chunks:
-                words = self.preprocessor.preprocess_text(chunk.content)
-                word_counts.update(words)
-            
-            # Get top words by frequency
-            top_words = [word for word, count in word_counts.most_common(self.preprocessor.max_vocabulary_size)]
-            self.vocabulary = {word: idx for idx, word in enumerate(top_words)}
-    
-    def build_tf_idf_vectors(self, chunks: List[ChunkInfo]) -> None:
+        self.chunks = chunks
+        self.vocabulary = {}
+        self.idf_scores = {}
+        self.tf_idf_vectors = {}
+        self.tf_idf_matrix = None
+
+        if not chunks:
+            return
+
+        if tokenized is None:
+            tokenized = [self.preprocessor.preprocess_text(chunk.content) for chunk in chunks]
+
+        matrix = self.vectorizer.fit_transform(tokenized)
+
+        self.tf_idf_matrix = matrix
+
+        # Expose the fitted vocabulary as a marisa trie: a fraction of a
+        # str->int dict's memory, O(word length) membership checks, and
+        # prefix iteration for free. Column lookups stay inside the
+        # vectorizer, so the trie's own ids need not match sklearn's.
+        feature_names = self.vectorizer.get_feature_names_out()
+        self.vocabulary = marisa_trie.Trie(feature_names.tolist())
+        self.idf_scores = dict(zip(feature_names, self.vectorizer.idf_))
+        self.tf_idf_vectors = {chunk.id: row for row, chunk in enumerate(chunks)}
+
+    def add_documents(self, chunks: List[ChunkInfo], tokenized: Optional[List[List[str]]] = None) -> None:
         """
-        Build TF-IDF vectors for all chunks
-        
+        Append new chunks to the fitted index without a full rebuild
+
+        New rows are vectorized against the existing vocabulary and stacked
+        onto the matrix, so the cost is linear in the added chunks. IDF
+        weights and the vocabulary stay as fitted: words first seen here
+        contribute nothing, so the search engine only takes this path when
+        its refit trigger judges the unseen-vocabulary mass negligible.
+
         Args:
-            chunks: List of chunks to process
+            chunks: New chunks to append
+            tokenized: Pre-tokenized chunk contents (optional, computed if not provided)
         """
-        self.chunks = chunks
-        
-        # Build vocabulary first
-        self.build_vocabulary(chunks)
-        
-        # Prepare documents for IDF calculation
-        documents = []
-        for chunk in chunks:
-            words = self.preprocessor.preprocess_text(chunk.content)
-            documents.append(words)
-        
-        # Calculate IDF scores
-        self.idf_scores = self.calculate_idf(documents)
-        
-        # Calculate TF-IDF vectors for each chunk
-        vocab_size = len(self.vocabulary)
-        for chunk in chunks:
-            words = self.preprocessor.preprocess_text(chunk.content)
-            tf_scores = self.calculate_tf(words)
-            
-            # Create TF-IDF vector
-            tf_idf_vector = np.zeros(vocab_size)
-            
-            for word, tf_score in tf_scores.items():
-                if word in self.vocabulary and word in self.idf_scores:
-                    word_idx = self.vocabulary[word]
-                    tf_idf_vector[word_idx] = tf_score * self.idf_scores[word]
-            
-            self.tf_idf_vectors[chunk.id] = tf_idf_vector
-    
-    def search(self, query: str, top_k: int = 5) -> List[Tuple[str, float]]:
+        if self.tf_idf_matrix is None:
+            raise ValueError("Cannot add documents before the index is built")
+
+        if tokenized is None:
+            tokenized = [self.preprocessor.preprocess_text(chunk.content) for chunk in chunks]
+
+        start_row = self.tf_idf_matrix.shape[0]
+        new_rows = self.vectorizer.transform(tokenized)
+        self.tf_idf_matrix = sparse.vstack([self.tf_idf_matrix, new_rows], format='csr')
+
+        for offset, chunk in enumerate(chunks):
+            self.tf_idf_vectors[chunk.id] = start_row + offset
+
+    def search(self, query: str, top_k: int = 5, query_tokens: Optional[List[str]] = None,
+               candidate_rows: Optional[np.ndarray] = None) -> List[Tuple[str, float]]:
         """
         Search for relevant chunks using TF-IDF
-        
+
         Args:
             query: Search query
             top_k: Number of top results to return
-            
+            query_tokens: Pre-tokenized query (optional, computed if not provided)
+            candidate_rows: Row indices to restrict scoring to (optional;
+                the full matrix is scored if not provided)
+
         Returns:
             List of (chunk_id, score) tuples
         """
-        if not self.chunks or not self.tf_idf_vectors:
+        if not self.chunks or self.tf_idf_matrix is None:
             return []
-        
-        # Preprocess query
-        query_words = self.preprocessor.preprocess_text(query)
-        
-        if not query_words:
+
+        if query_tokens is None:
+            query_tokens = self.preprocessor.preprocess_text(query)
+
+        # Vectorize the query; rows and the query are L2-normalized, so one
+        # sparse matrix-vector product gives cosine similarity to every chunk
+        query_vector = self.vectorizer.transform([query_tokens])
+        if query_vector.nnz == 0:
             return []
-        
-        # Calculate query TF-IDF vector
-        query_tf_scores = self.calculate_tf(query_words)
-        vocab_size = len(self.vocabulary)
-        query_vector = np.zeros(vocab_size)
-        
-        for word, tf_score in query_tf_scores.items():
-            if word in self.vocabulary and word in self.idf_scores:
-                word_idx = self.vocabulary[word]
-                query_vector[word_idx] = tf_score * self.idf_scores[word]
-        
-        # Calculate cosine similarity with all chunks
-        similarities = []
-        for chunk in self.chunks:
-            if chunk.id in self.tf_idf_vectors:
-                chunk_vector = self.tf_idf_vectors[chunk.id]
-                
-                # Calculate cosine similarity
-                similarity = self._cosine_similarity(query_vector, chunk_vector)
-                similarities.append((chunk.id, similarity))
-        
-        # Sort by similarity and return top_k results
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_k]
-    
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """
-        Calculate cosine similarity between two vectors
-        
-        Args:
-            vec1: First vector
-            vec2: Second vector
-            
-        Returns:
-            Cosine similarity score
-        """
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
-        
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        
-        return dot_product / (norm1 * norm2)
-    
+
+        # Restricting to a candidate pool turns the matmul from O(corpus)
+        # into O(candidates); chunks outside it would score zero anyway
+        matrix = self.tf_idf_matrix if candidate_rows is None else self.tf_idf_matrix[candidate_rows]
+        scores = np.asarray((matrix @ query_vector.T).todense()).ravel()
+
+        # Partial top-k selection avoids sorting the full score array
+        if top_k < len(scores):
+            top_indices = np.argpartition(scores, -top_k)[-top_k:]
+        else:
+            top_indices = np.arange(len(scores))
+        top_indices = top_indices[np.argsort(scores[top_indices])[::-1]]
+
+        if candidate_rows is not None:
+            return [(self.chunks[candidate_rows[i]].id, float(scores[i])) for i in top_indices]
+        return [(self.chunks[i].id, float(scores[i])) for i in top_indices]
+
     def get_vocabulary_stats(self) -> Dict[str, int]:
         """Get vocabulary statistics"""
         return {
@@ -0,0 +1,87 @@
+"""
+Semantic Query Cache Module
+
+Caches full query responses keyed on the TF-IDF vector of the query, so
+repeated and near-duplicate questions skip retrieval and the LLM call.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from models import QueryResponse
+
+class SemanticQueryCache:
+    """Near-duplicate response cache over L2-normalized query vectors"""
+
+    def __init__(self, similarity_threshold: float = 0.95,
+                 max_entries: int = 256, ttl_seconds: float = 600.0):
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        # Insertion-ordered for LRU eviction: hits move to the end, the
+        # head is the coldest entry. Values are
+        # (query_vector, response, inserted_at, corpus_key).
+        self._entries = OrderedDict()
+        self._next_key = 0
+        self._lock = threading.Lock()
+
+    def get(self, query_vector, corpus_key: Tuple[int, int]) -> Optional[QueryResponse]:
+        """
+        Look up a cached response for a semantically similar query
+
+        Vectors are L2-normalized, so one sparse dot product per entry
+        gives cosine similarity; with at most max_entries candidates the
+        probe costs microseconds against a multi-second LLM call.
+
+        Args:
+            query_vector: L2-normalized TF-IDF vector of the query
+            corpus_key: Current (index generation, chunk count); entries
+                cached against any other index state are dropped, so a
+                cleared-and-replaced corpus of equal size cannot serve
+                answers generated from the old documents
+
+        Returns:
+            Cached QueryResponse, or None on a miss
+        """
+        now = time.monotonic()
+        with self._lock:
+            best_key = None
+            for key, (vector, response, inserted_at, cached_corpus) in list(self._entries.items()):
+                if now - inserted_at > self.ttl_seconds or cached_corpus != corpus_key:
+                    del self._entries[key]
+                    continue
+                similarity = (query_vector @ vector.T)[0, 0]
+                if similarity >= self.similarity_threshold:
+                    best_key = key
+                    break
+
+            if best_key is None:
+                return None
+            self._entries.move_to_end(best_key)
+            return self._entries[best_key][1]
+
+    def put(self, query_vector, response: QueryResponse, corpus_key: Tuple[int, int]) -> None:
+        """
+        Cache a response against its query vector
+
+        Args:
+            query_vector: L2-normalized TF-IDF vector of the query
+            response: Completed response to cache
+            corpus_key: (index generation, chunk count) the response was
+                generated against
+        """
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries.popitem(last=False)
+            self._entries[self._next_key] = (
+                query_vector, response, time.monotonic(), corpus_key
+            )
+            self._next_key += 1
+
+    def clear(self) -> None:
+        """Drop all cached responses"""
+        with self._lock:
+            self._entries.clear()
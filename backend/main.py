@@ -9,4 +9,9 @@ from app import app
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    # uvloop and httptools (bundled with uvicorn[standard]) are pinned
+    # explicitly rather than left to "auto" detection. Kept single-worker:
+    # storage, the search index, and the rate limiter default all live
+    # in-process, so extra workers would each see their own corpus; scale
+    # out only after moving that state to a shared backend.
+    uvicorn.run(app, host="127.0.0.1", port=8000, loop="uvloop", http="httptools")
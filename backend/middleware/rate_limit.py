@@ -0,0 +1,22 @@
+"""
+Rate Limiting Middleware
+
+Provides the single shared slowapi limiter used by all route modules.
+"""
+
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from config import settings
+
+# One limiter instance for the whole app. Pointing RATE_LIMIT_STORAGE_URI
+# at Redis (redis://host:port) keeps the counters in shared storage, so
+# limits stay correct when uvicorn runs multiple workers — the default
+# in-memory backend is per-process, which silently multiplies the
+# effective limit by the worker count. The moving-window strategy gives
+# a rolling window instead of fixed-window bursts at the boundary.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    strategy="moving-window"
+)
@@ -5,13 +5,13 @@ Handles health check and system status endpoints
 """
 
 from fastapi import APIRouter, Request
-from slowapi.util import get_remote_address
 import time
 import logging
 import os
 from typing import Optional
 
 from config import settings
+from middleware.rate_limit import limiter
 from storage import storage
 
 # Configure logging
@@ -19,8 +19,25 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["health"])
 
+# Storage stats cached for ~1s on the monotonic clock: load balancer
+# probes hit these endpoints far more often than storage changes, and
+# get_storage_stats walks the document dict on every call
+_STATS_TTL_SECONDS = 1.0
+_stats_cache = (0.0, None)  # (monotonic timestamp, stats dict)
+
+def _get_cached_storage_stats() -> dict:
+    """Return storage stats, refreshed at most once per TTL window"""
+    global _stats_cache
+    now = time.monotonic()
+    cached_at, stats = _stats_cache
+    if stats is None or now - cached_at > _STATS_TTL_SECONDS:
+        stats = storage.get_storage_stats()
+        _stats_cache = (now, stats)
+    return stats
+
 @router.get("/health")
-async def health_check():
+@limiter.limit(settings.RATE_LIMIT_HEALTH)
+async def health_check(request: Request):
     """Enhanced health check for production"""
     try:
         # Check if API key is configured (safely)
@@ -29,18 +46,20 @@ async def health_check():
             return {"status": "unhealthy", "error": "API key not configured"}
         
         # Check storage
-        storage_stats = storage.get_storage_stats()
+        storage_stats = _get_cached_storage_stats()
         
         return {
             "status": "healthy",
             "timestamp": time.time(),
             "environment": os.getenv("ENVIRONMENT", "development"),
+            "pipeline_ready": request.app.state.pipeline_ready,
             "storage": storage_stats
         }
     except Exception as e:
         return {"status": "unhealthy", "error": str(e)}
 
 @router.get("/status")
+@limiter.limit(settings.RATE_LIMIT_HEALTH)
 async def system_status(request: Request):
     """
     Detailed system status endpoint
@@ -49,14 +68,14 @@ async def system_status(request: Request):
         System status with storage statistics
     """
     try:
-        stats = storage.get_storage_stats()
+        stats = _get_cached_storage_stats()
         return {
             "status": "healthy",
             "timestamp": time.time(),
             "storage": stats
         }
     except Exception as e:
-        logger.error(f"Error getting system status: {str(e)}")
+        logger.error("Error getting system status: %s", e)
         return {
             "status": "error",
             "timestamp": time.time(),
@@ -5,12 +5,15 @@ Handles file upload and processing endpoints
 """
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, Request
-from slowapi.util import get_remote_address
 from typing import List
+import aiofiles.tempfile
+import asyncio
 import logging
+import os
 
-from models import UploadResponse, DocumentInfo
+from models import UploadResponse, DocumentInfo, ChunkInfo
 from config import settings
+from middleware.rate_limit import limiter
 from core.pdf_processor import PDFProcessor
 from storage import storage
 
@@ -19,10 +22,26 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/ingest", tags=["ingest"])
 
+# Uploads are streamed to disk in chunks of this size, so peak memory per
+# upload is one chunk rather than the whole file
+_UPLOAD_READ_CHUNK = 64 * 1024
+_MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # 10MB limit
+
+# One processor for the module: it holds only the chunking parameters, so
+# it is safe to share across worker threads and there is no reason to
+# reconstruct it per file
+_PDF_PROCESSOR = PDFProcessor(
+    chunk_size=settings.CHUNK_SIZE,
+    chunk_overlap=settings.CHUNK_OVERLAP
+)
+
 def _validate_file(file: UploadFile) -> None:
     """
     Validate uploaded file
     
+    The size cap is enforced while streaming in _spool_to_tempfile rather
+    than here: file.size is unreliable under chunked transfer encoding.
+    
     Args:
         file: Uploaded file to validate
         
@@ -34,19 +53,60 @@ def _validate_file(file: UploadFile) -> None:
             status_code=400, 
             detail="Only PDF files are allowed"
         )
+
+async def _spool_to_tempfile(file: UploadFile) -> str:
+    """
+    Stream an upload into a temp file, enforcing the size cap on the fly
     
-    if file.size > 10 * 1024 * 1024:  # 10MB limit
-        raise HTTPException(
-            status_code=400, 
-            detail="File size must be less than 10MB"
-        )
+    Reads the upload in 64KB chunks so a concurrent upload holds one
+    chunk in memory instead of the whole PDF, and rejects oversized
+    files as soon as the cap is crossed instead of after the transfer.
+    The first bytes off the wire must be the %PDF- magic: content_type
+    is a client-controlled header, and rejecting here is far cheaper
+    than letting the parser fail on a mislabeled file.
+    
+    Args:
+        file: Uploaded file to spool
+        
+    Returns:
+        Path of the temp file (caller is responsible for removing it)
+        
+    Raises:
+        HTTPException: If the upload exceeds the size limit or does not
+            start with the PDF magic bytes
+    """
+    received = 0
+    async with aiofiles.tempfile.NamedTemporaryFile('wb', suffix='.pdf', delete=False) as spool:
+        try:
+            while chunk := await file.read(_UPLOAD_READ_CHUNK):
+                if received == 0 and not chunk.startswith(b'%PDF-'):
+                    raise HTTPException(
+                        status_code=400, 
+                        detail=f"File {file.filename} is not a valid PDF"
+                    )
+                received += len(chunk)
+                if received > _MAX_UPLOAD_BYTES:
+                    raise HTTPException(
+                        status_code=400, 
+                        detail="File size must be less than 10MB"
+                    )
+                await spool.write(chunk)
+        except BaseException:
+            os.remove(spool.name)
+            raise
+        return str(spool.name)
 
-def _process_pdf_file(file: UploadFile) -> dict:
+def _process_pdf_file(pdf_path: str, filename: str) -> dict:
     """
-    Process a single PDF file
+    Process a single spooled PDF file
+    
+    Blocking CPU/IO work: run it off the event loop via asyncio.to_thread.
+    Storage mutations are deliberately left to the caller so concurrent
+    workers never touch the shared dicts.
     
     Args:
-        file: PDF file to process
+        pdf_path: Path of the spooled temp file
+        filename: Original upload filename
         
     Returns:
         Processing result with document info and chunks
@@ -55,65 +115,74 @@ def _process_pdf_file(file: UploadFile) -> dict:
         HTTPException: If processing fails
     """
     try:
-        # Initialize PDF processor
-        pdf_processor = PDFProcessor(
-            chunk_size=settings.CHUNK_SIZE,
-            chunk_overlap=settings.CHUNK_OVERLAP
-        )
-        
         # Process the PDF
-        result = pdf_processor.process_pdf(file.file, file.filename)
-        
-        # Store in storage
-        storage.add_document(
-            result["document_id"],
-            {
-                "filename": result["filename"],
-                "chunk_count": result["chunk_count"],
-                "total_characters": result["total_characters"]
-            }
-        )
-        storage.add_chunks(result["document_id"], result["chunks"])
-        
-        return result
+        return _PDF_PROCESSOR.process_pdf(pdf_path, filename)
         
     except Exception as e:
-        logger.error(f"Error processing file {file.filename}: {str(e)}")
+        logger.error("Error processing file %s: %s", filename, e)
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to process file {file.filename}: {str(e)}"
+            detail=f"Failed to process file {filename}: {str(e)}"
         )
 
-def _initialize_search_engine() -> None:
-    """Initialize the search engine with all chunks"""
+async def _ingest_one(file: UploadFile) -> dict:
+    """
+    Validate, spool, and parse a single upload end to end
+    
+    One coroutine per file lets asyncio.gather run the whole ingest as a
+    single parallel fan-out instead of separate validate/spool/process
+    passes over the file list.
+    
+    Args:
+        file: Uploaded file to ingest
+        
+    Returns:
+        Processing result with document info and chunks
+        
+    Raises:
+        HTTPException: If validation, spooling, or processing fails
+    """
+    _validate_file(file)
+    pdf_path = await _spool_to_tempfile(file)
+    try:
+        return await asyncio.to_thread(_process_pdf_file, pdf_path, file.filename)
+    finally:
+        try:
+            os.remove(pdf_path)
+        except OSError:
+            pass
+
+def _add_chunks_to_search_engine(new_chunks: List[ChunkInfo]) -> None:
+    """
+    Feed newly ingested chunks to the search engine
+
+    Usually incremental — only the chunks from this upload are indexed,
+    keeping the per-upload cost O(new chunks) — but the engine refits the
+    whole index when this upload brings enough unseen vocabulary that the
+    fitted index would miss it, so new-topic documents stay findable. The
+    PDF processor emits ChunkInfo objects directly, so no dict coercion
+    pass is needed.
+
+    Args:
+        new_chunks: Chunks produced by this upload
+    """
     try:
         from routes.query import get_rag_pipeline
         pipeline = get_rag_pipeline()
-        
-        # Convert chunks to ChunkInfo objects if needed
-        from models import ChunkInfo
-        chunk_infos = []
-        for chunk in storage.get_all_chunks():
-            if isinstance(chunk, dict):
-                chunk_info = ChunkInfo(
-                    id=chunk["id"],
-                    content=chunk["content"],
-                    document_id=chunk["document_id"],
-                    chunk_index=chunk["chunk_index"]
-                )
-                chunk_infos.append(chunk_info)
-            else:
-                chunk_infos.append(chunk)
-        
-        # Build search engine with chunks
-        pipeline.search_engine.build_index(chunk_infos)
-        logger.info(f"Search engine initialized with {len(chunk_infos)} chunks")
-        
+
+        rebuilt = pipeline.search_engine.add_chunks(new_chunks)
+        logger.info(
+            "Search engine %s with %d new chunks (%d total)",
+            "fully rebuilt" if rebuilt else "updated incrementally",
+            len(new_chunks), storage.get_chunk_count()
+        )
+
     except Exception as e:
-        logger.error(f"Failed to initialize search engine: {str(e)}")
+        logger.error("Failed to update search engine: %s", e)
         raise
 
 @router.post("/", response_model=UploadResponse)
+@limiter.limit(settings.RATE_LIMIT_UPLOAD)
 async def ingest_files(
     request: Request, 
     files: List[UploadFile] = File(...), 
@@ -134,35 +203,59 @@ async def ingest_files(
         HTTPException: If upload or processing fails
     """
     
-    # Clear previous documents if requested
+    # Clear previous documents if requested; the index must be dropped
+    # explicitly now that uploads no longer trigger a full rebuild
     if clear_previous:
         storage.clear_all()
+        from routes.query import get_rag_pipeline
+        get_rag_pipeline().search_engine.clear_index()
     
     try:
-        # Validate all files
-        for file in files:
-            _validate_file(file)
+        # One fan-out handles everything per file: validate, stream to
+        # disk with the size cap enforced mid-transfer, and parse in a
+        # worker thread. Running the blocking PyPDF2 work inline would
+        # stall the event loop (and with it /query and /health) for the
+        # whole upload, and N files finish in roughly max(per-file)
+        # instead of sum(per-file).
+        results = await asyncio.gather(
+            *[_ingest_one(file) for file in files],
+            return_exceptions=True
+        )
         
-        # Process each PDF file
+        # Reject the whole batch before touching storage: raising once
+        # mutations have started would leave documents stored but never
+        # indexed, visible in stats yet unsearchable
+        for result in results:
+            if isinstance(result, HTTPException):
+                raise result
+
+        # Apply storage mutations here, after the gather, so the shared
+        # dicts are only touched from the event loop
         processed_documents = []
-        for file in files:
-            try:
-                result = _process_pdf_file(file)
-                
-                # Create document info for response
-                doc_info = DocumentInfo(
-                    id=result["document_id"],
-                    filename=result["filename"]
-                )
-                processed_documents.append(doc_info)
-                
-            except HTTPException:
-                # Re-raise HTTP exceptions
-                raise
-            except Exception as e:
+        new_chunks = []
+        for file, result in zip(files, results):
+            if isinstance(result, BaseException):
                 # Log error but continue processing other files
-                logger.error(f"Error processing file {file.filename}: {str(e)}")
+                logger.error("Error processing file %s: %s", file.filename, result)
                 continue
+
+            storage.add_document(
+                result["document_id"],
+                {
+                    "filename": result["filename"],
+                    "chunk_count": result["chunk_count"],
+                    "total_characters": result["total_characters"]
+                }
+            )
+            storage.add_chunks(result["document_id"], result["chunks"])
+            new_chunks.extend(result["chunks"])
+            
+            # Create document info for response
+            doc_info = DocumentInfo(
+                id=result["document_id"],
+                filename=result["filename"]
+            )
+            processed_documents.append(doc_info)
         
         if not processed_documents:
             raise HTTPException(
@@ -170,9 +263,10 @@ async def ingest_files(
                 detail="No PDF files were successfully processed"
             )
         
-        # Initialize search engine with new chunks
-        logger.info(f"Total chunks to initialize: {storage.get_chunk_count()}")
-        _initialize_search_engine()
+        # Index this upload's chunks; the engine decides whether the add
+        # can stay incremental or the vocabulary shift warrants a refit
+        logger.info("Total chunks to initialize: %d", storage.get_chunk_count())
+        _add_chunks_to_search_engine(new_chunks)
         
         return UploadResponse(documents=processed_documents)
         
@@ -180,7 +274,7 @@ async def ingest_files(
         raise  # Re-raise HTTP exceptions
     except Exception as e:
         # Don't expose internal error details
-        logger.error(f"Upload error: {str(e)}")
+        logger.error("Upload error: %s", e)
         raise HTTPException(
             status_code=500, 
             detail="Internal server error"
@@ -4,11 +4,15 @@ Query Routes
 Handles knowledge base query endpoints
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 from models import QueryRequest, QueryResponse
 from core.rag_pipeline import RAGPipeline
-from slowapi.util import get_remote_address
+from middleware.rate_limit import limiter
 from config import settings
+import asyncio
+import threading
 import time
 import logging
 
@@ -18,24 +22,97 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/query", tags=["query"])
 
+# Shared serializer for the hot /query response path: dumping through
+# the adapter and returning a Response directly skips FastAPI's
+# re-validation of the response model, which costs a full second pass
+# over the chunk list per request
+_QUERY_RESPONSE_ADAPTER = TypeAdapter(QueryResponse)
+
 # Global RAG pipeline instance
 rag_pipeline = None
+_pipeline_lock = threading.Lock()
 
 def get_rag_pipeline():
-    """Get or create RAG pipeline instance"""
+    """
+    Get or create the RAG pipeline instance
+
+    Double-checked locking: a cold-start burst of concurrent requests
+    would otherwise race the unguarded check-then-set and build several
+    pipelines, keeping only the last. The fast path stays a single
+    attribute read once initialized; the startup hook builds the
+    instance before traffic arrives.
+    """
     global rag_pipeline
     if rag_pipeline is None:
-        rag_pipeline = RAGPipeline()
+        with _pipeline_lock:
+            if rag_pipeline is None:
+                rag_pipeline = RAGPipeline()
     return rag_pipeline
 
 
 
+@router.post("/summary/stream")
+@limiter.limit(settings.RATE_LIMIT_QUERY)
+async def stream_summary(
+    request: Request,
+    query_request: QueryRequest,
+    pipeline: RAGPipeline = Depends(get_rag_pipeline)
+) -> StreamingResponse:
+    """
+    Stream a document summary back as Server-Sent Events
+
+    Tokens are sent as they arrive from the LLM, so the client can render
+    the summary progressively instead of waiting for the full completion.
+
+    Args:
+        request: FastAPI request object
+        query_request: Query request containing the user's question
+        pipeline: RAG pipeline instance
+
+    Returns:
+        StreamingResponse emitting SSE frames
+    """
+    return StreamingResponse(
+        pipeline.response_generator.stream_summary_request(query_request),
+        media_type="text/event-stream"
+    )
+
+
+@router.post("/stream")
+@limiter.limit(settings.RATE_LIMIT_QUERY)
+async def stream_query(
+    request: Request,
+    query_request: QueryRequest,
+    pipeline: RAGPipeline = Depends(get_rag_pipeline)
+) -> StreamingResponse:
+    """
+    Stream a query answer back as Server-Sent Events
+
+    The retrieved chunks arrive as soon as search completes, followed by
+    the answer token-by-token, so clients can show sources and a growing
+    answer instead of waiting for the full pipeline.
+
+    Args:
+        request: FastAPI request object
+        query_request: Query request containing the user's question
+        pipeline: RAG pipeline instance
+
+    Returns:
+        StreamingResponse emitting SSE frames
+    """
+    return StreamingResponse(
+        pipeline.stream_query(query_request),
+        media_type="text/event-stream"
+    )
+
+
 @router.post("/", response_model=QueryResponse)
+@limiter.limit(settings.RATE_LIMIT_QUERY)
 async def query_knowledge_base(
     request: Request,
     query_request: QueryRequest,
     pipeline: RAGPipeline = Depends(get_rag_pipeline)
-) -> QueryResponse:
+) -> Response:
     """
     Query the knowledge base with a question
     
@@ -49,36 +126,43 @@ async def query_knowledge_base(
     Raises:
         HTTPException: If query processing fails
     """
-    start_time = time.time()
+    # perf_counter is monotonic and cheaper than time.time on Linux
+    start_time = time.perf_counter()
     
     try:
-        # Validate request
-        if not query_request.query or not query_request.query.strip():
-            raise HTTPException(
-                status_code=400, 
-                detail="Query cannot be empty"
-            )
-        
+        # Empty and whitespace-only queries are rejected at parse time by
+        # the QueryRequest constraints, before dependency resolution
+
         # Log the incoming query
-        logger.info(f"Processing query: {query_request.query[:100]}...")
+        logger.info("Processing query: %.100s...", query_request.query)
+        
+        # Fast path: simple intents return a pre-encoded JSON body
+        fast_json = pipeline.try_simple_intent_response_json(query_request)
+        if fast_json is not None:
+            return Response(content=fast_json, media_type="application/json")
         
-        # Process query through RAG pipeline
-        response = pipeline.process_query(query_request)
+        # Process query through RAG pipeline in a worker thread: the
+        # pipeline is blocking (search, prompting, HTTP to the LLM), and
+        # running it inline would stall the event loop and serialize
+        # every concurrent query
+        response = await asyncio.to_thread(pipeline.process_query, query_request)
         
         # Calculate processing time
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         
         # Log response details
-        logger.info(f"Query processed in {processing_time:.2f}s with {len(response.chunks)} chunks")
+        logger.info("Query processed in %.2fs with %d chunks", processing_time, len(response.chunks))
         
-        return response
+        # The response_model in the decorator stays for the OpenAPI schema;
+        # serializing here avoids the validation re-entry
+        return ORJSONResponse(_QUERY_RESPONSE_ADAPTER.dump_python(response, mode='json'))
         
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
         # Log unexpected errors
-        logger.error(f"Unexpected error processing query: {str(e)}")
+        logger.error("Unexpected error processing query: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Internal server error: {str(e)}"
@@ -5,75 +5,194 @@ This module handles all in-memory storage operations for documents and chunks.
 Provides a clean interface for storage operations and maintains data consistency.
 """
 
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
+import threading
 from models import DocumentInfo, ChunkInfo
 
 logger = logging.getLogger(__name__)
 
+# Chunks are stored in immutable blocks of this many entries; appends
+# allocate small blocks instead of recopying one ever-growing sequence
+_CHUNK_BLOCK_SIZE = 4096
+
+@dataclass(slots=True, frozen=True)
+class StoredDocument:
+    """Per-document metadata held in storage
+
+    A slotted dataclass instead of a dict: fixed fields cost roughly half
+    the memory of a small dict per document, and attribute access is an
+    offset load rather than a hash lookup.
+    """
+    filename: str
+    chunk_count: int = 0
+    total_characters: int = 0
+
 class DocumentStorage:
     """Manages in-memory storage for documents and chunks"""
     
     def __init__(self):
-        self._documents: Dict[str, dict] = {}  # document_id -> document_info
+        self._documents: Dict[str, StoredDocument] = {}  # document_id -> metadata
         self._chunks: Dict[str, List[dict]] = {}  # document_id -> list of chunks
-        self._all_chunks: List[dict] = []  # List of all chunks for search engine
+        
+        # All chunks live in a tuple of immutable fixed-size blocks,
+        # replaced wholesale on every mutation. Readers grab the current
+        # outer tuple without locking — the reference swap is atomic
+        # under the GIL — so a clear or ingest can never expose them to
+        # half-updated state, and appends only allocate the new blocks
+        # plus a small outer tuple instead of recopying the whole corpus.
+        self._chunk_blocks: Tuple[Tuple, ...] = ()
+        self._chunk_count = 0
+        self._document_count = 0
+        self._doc_ids: Tuple = ()  # snapshot of document ids, for stats
+        self._doc_infos: Tuple = ()  # snapshot of DocumentInfo models
+        self._write_lock = threading.Lock()
         
     def add_document(self, document_id: str, document_info: dict) -> None:
         """Add a document to storage"""
-        self._documents[document_id] = document_info
-        logger.info(f"Added document {document_id} to storage")
+        stored = StoredDocument(
+            filename=document_info["filename"],
+            chunk_count=document_info.get("chunk_count", 0),
+            total_characters=document_info.get("total_characters", 0)
+        )
+        with self._write_lock:
+            self._documents[document_id] = stored
+            # Maintain the DocumentInfo snapshot on write so reads never
+            # reconstruct Pydantic models; a re-added id rebuilds the
+            # snapshot to pick up the new filename
+            if document_id in self._doc_ids:
+                self._doc_infos = tuple(
+                    DocumentInfo(id=doc_id, filename=self._documents[doc_id].filename)
+                    for doc_id in self._doc_ids
+                )
+            else:
+                self._doc_ids = self._doc_ids + (document_id,)
+                self._doc_infos = self._doc_infos + (
+                    DocumentInfo(id=document_id, filename=stored.filename),
+                )
+                self._document_count += 1
+        logger.info("Added document %s to storage", document_id)
         
     def add_chunks(self, document_id: str, chunks: List[dict]) -> None:
         """Add chunks for a document to storage"""
-        self._chunks[document_id] = chunks
-        self._all_chunks.extend(chunks)
-        logger.info(f"Added {len(chunks)} chunks for document {document_id}")
+        with self._write_lock:
+            self._chunks[document_id] = chunks
+            blocks = list(self._chunk_blocks)
+            pending = tuple(chunks)
+            # Top up the trailing partial block, then cut the rest into
+            # fresh fixed-size blocks
+            if blocks and len(blocks[-1]) < _CHUNK_BLOCK_SIZE:
+                room = _CHUNK_BLOCK_SIZE - len(blocks[-1])
+                blocks[-1] = blocks[-1] + pending[:room]
+                pending = pending[room:]
+            for start in range(0, len(pending), _CHUNK_BLOCK_SIZE):
+                blocks.append(pending[start:start + _CHUNK_BLOCK_SIZE])
+            self._chunk_blocks = tuple(blocks)
+            self._chunk_count += len(chunks)
+        logger.info("Added %d chunks for document %s", len(chunks), document_id)
         
-    def get_document(self, document_id: str) -> Optional[dict]:
-        """Get document information by ID"""
+    def remove_document(self, document_id: str) -> bool:
+        """
+        Remove a document and its chunks from storage
+
+        The per-document chunk mapping is the reverse index, so finding a
+        document's chunks is O(1); the block snapshot is rebuilt from the
+        remaining documents in one pass and swapped in atomically, so
+        readers only ever see the corpus fully with or fully without the
+        document.
+
+        Args:
+            document_id: ID of the document to remove
+
+        Returns:
+            True if the document existed and was removed
+        """
+        with self._write_lock:
+            if document_id not in self._documents:
+                return False
+            del self._documents[document_id]
+            self._chunks.pop(document_id, None)
+
+            remaining = tuple(
+                chunk for chunks in self._chunks.values() for chunk in chunks
+            )
+            self._chunk_blocks = tuple(
+                remaining[start:start + _CHUNK_BLOCK_SIZE]
+                for start in range(0, len(remaining), _CHUNK_BLOCK_SIZE)
+            )
+            self._chunk_count = len(remaining)
+            self._document_count -= 1
+            self._doc_ids = tuple(
+                doc_id for doc_id in self._doc_ids if doc_id != document_id
+            )
+            self._doc_infos = tuple(
+                info for info in self._doc_infos if info.id != document_id
+            )
+        logger.info("Removed document %s from storage", document_id)
+        return True
+
+    def get_document(self, document_id: str) -> Optional[StoredDocument]:
+        """Get document metadata by ID"""
         return self._documents.get(document_id)
         
     def get_chunks(self, document_id: str) -> List[dict]:
         """Get chunks for a specific document"""
         return self._chunks.get(document_id, [])
         
-    def get_all_chunks(self) -> List[dict]:
-        """Get all chunks for search engine initialization"""
-        return self._all_chunks.copy()
+    def get_all_chunks(self) -> List:
+        """Get all chunks, flattened from the current block snapshot"""
+        return list(self.iter_chunks())
+        
+    def iter_chunks(self) -> Iterator:
+        """
+        Iterate over all chunks without materializing a flat list
+        
+        Walks one consistent block snapshot, so concurrent ingests or
+        clears cannot affect an iteration already in progress.
+        """
+        blocks = self._chunk_blocks
+        for block in blocks:
+            yield from block
         
     def get_all_documents(self) -> List[DocumentInfo]:
-        """Get all documents as DocumentInfo objects"""
-        documents = []
-        for doc_id, doc_info in self._documents.items():
-            document = DocumentInfo(
-                id=doc_id,
-                filename=doc_info["filename"]
-            )
-            documents.append(document)
-        return documents
+        """Get all documents as DocumentInfo objects, from the snapshot"""
+        return list(self._doc_infos)
         
     def clear_all(self) -> None:
         """Clear all stored documents and chunks"""
-        self._documents.clear()
-        self._chunks.clear()
-        self._all_chunks.clear()
+        # Swap in fresh containers instead of clearing in place, so any
+        # reader holding the old snapshot still sees a consistent corpus
+        with self._write_lock:
+            self._documents = {}
+            self._chunks = {}
+            self._chunk_blocks = ()
+            self._chunk_count = 0
+            self._document_count = 0
+            self._doc_ids = ()
+            self._doc_infos = ()
         logger.info("Cleared all documents and chunks from storage")
         
     def get_document_count(self) -> int:
         """Get the number of stored documents"""
-        return len(self._documents)
+        return self._document_count
         
     def get_chunk_count(self) -> int:
         """Get the total number of chunks"""
-        return len(self._all_chunks)
+        return self._chunk_count
         
     def get_storage_stats(self) -> dict:
-        """Get storage statistics"""
+        """
+        Get storage statistics
+        
+        Pure attribute reads: the counts are O(1) lens and the document
+        id snapshot is maintained on write, so async handlers calling
+        this never walk the dicts or allocate per request.
+        """
         return {
             "document_count": self.get_document_count(),
             "chunk_count": self.get_chunk_count(),
-            "documents": list(self._documents.keys())
+            "documents": self._doc_ids
         }
 
 # Global storage instance